@@ -338,10 +338,7 @@ class RuleBasedAI(BaseAI):
     ) -> dict[str, Any] | None:
         """Decide if should buy an additional train."""
         # Don't buy if at train limit
-        phase = self.state.train_depot.current_phase
-        limit = 4 if phase <= 3 else 3 if phase <= 5 else 2
-
-        if len(company.trains) >= limit:
+        if len(company.trains) >= self.state.train_depot.train_limit:
             return None
 
         # Check if upgrade is worthwhile
@@ -347,6 +347,8 @@ class GameRepository:
                 priority_deal=bool(game_player.priority_deal),
             )
             state.players[player.id] = player
+            if player.priority_deal:
+                state.priority_deal_player_id = player.id
         t_players_ms = (time.perf_counter() - t_players_start) * 1000
 
         # Load companies
@@ -383,6 +385,7 @@ class GameRepository:
                         if company:
                             company.trains.append(train)
                     break
+        state.train_depot.rebuild_index()
         t_trains_ms = (time.perf_counter() - t_trains_start) * 1000
 
         # Initialize stock market
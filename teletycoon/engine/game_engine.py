@@ -498,14 +498,15 @@ class GameEngine:
                 "message": f"{player.name} passed. Stock round ended.",
             }
 
-        self.state.advance_to_next_player()
+        state = self.state
+        state.advance_to_next_player()
 
         # Skip passed players
-        while (
-            self.state.current_player
-            and self.state.current_player.id in self.state.passed_players
-        ):
-            self.state.advance_to_next_player()
+        passed_players = state.passed_players
+        current = state.current_player
+        while current and current.id in passed_players:
+            state.advance_to_next_player()
+            current = state.current_player
 
         return {"success": True, "message": f"{player.name} passed."}
 
@@ -169,12 +169,7 @@ class OperatingRound:
 
     def _train_limit(self) -> int:
         """Get train limit based on current phase."""
-        phase = self.state.train_depot.current_phase
-        if phase <= 3:
-            return 4
-        elif phase <= 5:
-            return 3
-        return 2
+        return self.state.train_depot.train_limit
 
     def execute_action(
         self, company: "Company", action: dict[str, Any]
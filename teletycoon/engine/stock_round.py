@@ -62,8 +62,8 @@ class StockRound:
         actions = []
 
         # Check certificate limit
-        total_certs = self._count_player_certificates(player.id)
-        cert_limit = self._get_certificate_limit()
+        total_certs = self.state.count_certificates(player.id)
+        cert_limit = self.state.cert_limit
         can_buy = total_certs < cert_limit
 
         for company_id, company in self.state.companies.items():
@@ -148,28 +148,6 @@ class StockRound:
 
         return actions
 
-    def _count_player_certificates(self, player_id: str) -> int:
-        """Count total certificates held by a player."""
-        total = 0
-        for company_id in self.state.companies:
-            stock = self.state.stock_market.get_stock(company_id)
-            if stock:
-                shares = stock.get_player_shares(player_id)
-                # President cert counts as 1, others as 1 each
-                if shares > 0:
-                    company = self.state.companies[company_id]
-                    if company.president_id == player_id:
-                        total += 1  # President cert
-                        total += max(0, shares - 2)  # Other shares
-                    else:
-                        total += shares
-        return total
-
-    def _get_certificate_limit(self) -> int:
-        """Get certificate limit based on player count."""
-        limits = {2: 28, 3: 20, 4: 16, 5: 13, 6: 11}
-        return limits.get(len(self.state.players), 16)
-
     def _can_sell_shares(self, player_id: str, company_id: str, count: int) -> bool:
         """Check if player can sell shares without breaking rules."""
         stock = self.state.stock_market.get_stock(company_id)
@@ -187,10 +165,7 @@ class StockRound:
             remaining = player_shares - count
             if remaining < 2:
                 # Check if someone else can be president
-                for other_id, other_shares in stock.player_shares.items():
-                    if other_id != player_id and other_shares >= 2:
-                        return True
-                return False
+                return stock.has_other_major_holder(player_id)
 
         return True
 
@@ -68,16 +68,11 @@ class TrainManager:
             return False, "Invalid train type"
 
         # Check phase
-        if train_info["phase"] > self.depot.current_phase:
+        if train_info.phase > self.depot.current_phase:
             return False, "Train not yet available"
 
         # Check if any available
-        available = [
-            t
-            for t in self.depot.trains
-            if t.train_type == train_type and t.owner_id is None and not t.rusted
-        ]
-        if not available:
+        if not self.depot.available_count(train_type):
             return False, "No trains of this type available"
 
         # Check train limit
@@ -86,7 +81,7 @@ class TrainManager:
             return False, f"At train limit ({train_limit})"
 
         # Check treasury
-        cost = train_info["cost"]
+        cost = train_info.cost
         if company.treasury < cost:
             return False, f"Insufficient funds (need ¥{cost})"
 
@@ -108,7 +103,7 @@ class TrainManager:
         if not can_buy:
             return None, []
 
-        cost = TRAIN_DEFINITIONS[train_type]["cost"]
+        cost = TRAIN_DEFINITIONS[train_type].cost
         train = self.depot.buy_train(train_type, company.id)
 
         if train:
@@ -147,12 +142,7 @@ class TrainManager:
         Returns:
             Maximum number of trains a company can own.
         """
-        phase = self.depot.current_phase
-        if phase <= 3:
-            return 4
-        elif phase <= 5:
-            return 3
-        return 2
+        return self.depot.train_limit
 
     def check_forced_train_buy(self, company: "Company") -> dict[str, Any] | None:
         """Check if a company needs to make a forced train purchase.
@@ -213,7 +203,7 @@ class TrainManager:
         Returns:
             Result of the forced purchase.
         """
-        cost = TRAIN_DEFINITIONS[train_type]["cost"]
+        cost = TRAIN_DEFINITIONS[train_type].cost
         shortfall = max(0, cost - company.treasury)
 
         if shortfall > 0:
@@ -69,11 +69,14 @@ STOCK_PRICES_1889 = [
     400,
 ]
 
+# Highest valid index on the stock price chart
+LAST_PRICE_INDEX = len(STOCK_PRICES_1889) - 1
+
 # Valid par values for starting a company
 PAR_VALUES_1889 = [65, 70, 75, 80, 85, 90, 95, 100]
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     """Represents a railroad company in 1889.
 
@@ -90,6 +93,7 @@ class Company:
         trains: List of trains owned by the company.
         tokens_remaining: Number of station tokens remaining.
         operated_this_round: Whether company has operated this OR.
+        label: Color emoji followed by the company ID, for display.
     """
 
     id: str
@@ -104,11 +108,16 @@ class Company:
     trains: list[Train] = field(default_factory=list)
     tokens_remaining: int = 3
     operated_this_round: bool = False
+    label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the display label once; color and ID never change."""
+        self.label = f"{self.color}{self.id}"
 
     @property
     def stock_price(self) -> int:
         """Get current stock price."""
-        if self.stock_price_index < len(STOCK_PRICES_1889):
+        if self.stock_price_index <= LAST_PRICE_INDEX:
             return STOCK_PRICES_1889[self.stock_price_index]
         return STOCK_PRICES_1889[-1]
 
@@ -133,7 +142,7 @@ class Company:
         except ValueError:
             # Find closest value
             self.stock_price_index = min(
-                range(len(STOCK_PRICES_1889)),
+                range(LAST_PRICE_INDEX + 1),
                 key=lambda i: abs(STOCK_PRICES_1889[i] - par_value),
             )
 
@@ -147,14 +156,14 @@ class Company:
 
     def remove_train(self, train: Train) -> None:
         """Remove a train from the company."""
-        if train in self.trains:
+        try:
             self.trains.remove(train)
+        except ValueError:
+            pass
 
     def move_stock_price_up(self, steps: int = 1) -> None:
         """Move stock price up on the chart."""
-        self.stock_price_index = min(
-            self.stock_price_index + steps, len(STOCK_PRICES_1889) - 1
-        )
+        self.stock_price_index = min(self.stock_price_index + steps, LAST_PRICE_INDEX)
 
     def move_stock_price_down(self, steps: int = 1) -> None:
         """Move stock price down on the chart."""
@@ -4,9 +4,10 @@ import logging
 import os
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 
-from .company import Company, create_1889_companies
+from .company import Company, CompanyStatus, create_1889_companies
 from .player import Player
 from .stock import StockMarket
 from .tile import Board
@@ -39,6 +40,15 @@ STARTING_MONEY_1889 = {
     6: 390,
 }
 
+# Certificate limit based on player count
+CERT_LIMITS_1889 = {
+    2: 28,
+    3: 20,
+    4: 16,
+    5: 13,
+    6: 11,
+}
+
 # Operating rounds per stock round based on phase
 OR_PER_SR = {
     2: 1,  # Phase 2: 1 OR per SR
@@ -50,7 +60,10 @@ OR_PER_SR = {
 }
 
 
-@dataclass
+_STOCK_PRICE = attrgetter("stock_price")
+
+
+@dataclass(slots=True)
 class GameState:
     """Complete game state for TeleTycoon 1889.
 
@@ -73,6 +86,7 @@ class GameState:
         bank_cash: Cash remaining in the bank.
         actions_this_turn: Number of actions taken this turn.
         passed_players: Set of players who have passed this SR.
+        priority_deal_player_id: Player holding priority deal, if any.
         game_log: Log of game events.
     """
 
@@ -92,8 +106,10 @@ class GameState:
     bank_cash: int = 12000  # 1889 bank size
     actions_this_turn: int = 0
     passed_players: set[str] = field(default_factory=set)
+    priority_deal_player_id: str | None = None
     game_log: list[dict[str, Any]] = field(default_factory=list)
     persisted_game_log_count: int = 0
+    logger: logging.Logger = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Post-initialization setup."""
@@ -109,37 +125,72 @@ class GameState:
         player_id = self.player_order[self.current_player_index]
         return self.players.get(player_id)
 
+    @property
+    def players_in_order(self) -> list[Player]:
+        """Get players in turn order."""
+        players = self.players
+        return [players[pid] for pid in self.player_order if pid in players]
+
     @property
     def active_companies(self) -> list[Company]:
         """Get all floated/active companies."""
-        from .company import CompanyStatus
-
         return [c for c in self.companies.values() if c.status == CompanyStatus.ACTIVE]
 
+    @property
+    def active_companies_by_price(self) -> list[Company]:
+        """Get active companies ordered by stock price (highest first)."""
+        return sorted(self.active_companies, key=_STOCK_PRICE, reverse=True)
+
     @property
     def operating_company(self) -> Company | None:
         """Get the currently operating company (during OR)."""
         if self.round_type != RoundType.OPERATING:
             return None
-        active = self.active_companies
-        if not active:
-            return None
-        # Companies operate in stock price order (highest first)
-        sorted_companies = sorted(active, key=lambda c: c.stock_price, reverse=True)
-        for company in sorted_companies:
-            if not company.operated_this_round:
-                return company
-        return None
+        # Companies operate in stock price order (highest first); max() keeps
+        # the first of equally priced companies, like the stable sort would
+        return max(
+            (
+                c
+                for c in self.companies.values()
+                if c.status == CompanyStatus.ACTIVE and not c.operated_this_round
+            ),
+            key=_STOCK_PRICE,
+            default=None,
+        )
+
+    @property
+    def cert_limit(self) -> int:
+        """Get the certificate limit for the current player count."""
+        return CERT_LIMITS_1889.get(len(self.players), 16)
 
     @property
     def phase_number(self) -> int:
         """Get current phase number (based on train type available)."""
         return self.train_depot.current_phase
 
+    def count_certificates(self, player_id: str) -> int:
+        """Count certificates held by a player.
+
+        The president's certificate covers two shares but counts once.
+        """
+        companies = self.companies
+        total = 0
+        for company_id, shares in self.stock_market.get_player_portfolio(
+            player_id
+        ).items():
+            company = companies.get(company_id)
+            if company is not None and company.president_id == player_id:
+                total += shares - 1 if shares > 1 else 1
+            else:
+                total += shares
+        return total
+
     def add_player(self, player: Player) -> None:
         """Add a player to the game."""
         self.players[player.id] = player
         self.player_order.append(player.id)
+        if player.priority_deal:
+            self.priority_deal_player_id = player.id
         self.logger.info(f"Player {player.name} ({player.id}) added to game {self.id}")
 
     def initialize_game(self) -> None:
@@ -207,9 +258,7 @@ class GameState:
         ]
         self.passed_players.clear()
 
-        # Reset operated flags
-        for company in self.companies.values():
-            company.operated_this_round = False
+        self._reset_operated_flags()
 
         self.log_event("stock_round_end", {"round_number": self.stock_round_number})
 
@@ -221,9 +270,7 @@ class GameState:
 
         self.operating_rounds_remaining -= 1
 
-        # Reset operated flags
-        for company in self.companies.values():
-            company.operated_this_round = False
+        self._reset_operated_flags()
 
         if self.operating_rounds_remaining <= 0:
             # Start new stock round
@@ -236,6 +283,12 @@ class GameState:
             {"round_number": self.operating_round_number},
         )
 
+    def _reset_operated_flags(self) -> None:
+        """Clear the operated flag on every company for a fresh OR."""
+        for company in self.companies.values():
+            if company.operated_this_round:
+                company.operated_this_round = False
+
     def start_stock_round(self) -> None:
         """Start a new stock round."""
         self.round_type = RoundType.STOCK
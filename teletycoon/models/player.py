@@ -1,5 +1,6 @@
 """Player model for TeleTycoon."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
@@ -16,7 +17,7 @@ class PlayerType(Enum):
     LLM = "llm"
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game.
 
@@ -70,10 +71,10 @@ class Player:
         """Check if player can afford an amount."""
         return self.cash >= amount
 
-    def net_worth(self, stock_prices: dict[str, int]) -> int:
+    def net_worth(self, stock_prices: Mapping[str, int]) -> int:
         """Calculate total net worth including cash and stock value."""
+        price = stock_prices.get
         stock_value = sum(
-            shares * stock_prices.get(company_id, 0)
-            for company_id, shares in self.stocks.items()
+            shares * price(company_id, 0) for company_id, shares in self.stocks.items()
         )
         return self.cash + stock_value
@@ -1,11 +1,13 @@
 """Stock model for TeleTycoon 1889."""
 
+from collections import defaultdict
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
 
-from .company import STOCK_PRICES_1889
+from .company import LAST_PRICE_INDEX, STOCK_PRICES_1889
 
 
-@dataclass
+@dataclass(slots=True)
 class StockPrice:
     """Represents a position on the stock price chart.
 
@@ -20,10 +22,7 @@ class StockPrice:
     @classmethod
     def from_index(cls, index: int) -> "StockPrice":
         """Create StockPrice from chart index."""
-        if index < 0:
-            index = 0
-        if index >= len(STOCK_PRICES_1889):
-            index = len(STOCK_PRICES_1889) - 1
+        index = max(min(index, LAST_PRICE_INDEX), 0)
         return cls(index=index, value=STOCK_PRICES_1889[index])
 
     @classmethod
@@ -34,13 +33,13 @@ class StockPrice:
         else:
             # Find closest value
             index = min(
-                range(len(STOCK_PRICES_1889)),
+                range(LAST_PRICE_INDEX + 1),
                 key=lambda i: abs(STOCK_PRICES_1889[i] - value),
             )
         return cls(index=index, value=STOCK_PRICES_1889[index])
 
 
-@dataclass
+@dataclass(slots=True)
 class Stock:
     """Represents stock ownership information.
 
@@ -52,9 +51,24 @@ class Stock:
     """
 
     company_id: str
-    player_shares: dict[str, int] = field(default_factory=dict)
+    player_shares: defaultdict[str, int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
     ipo_shares: int = 10
     market_shares: int = 0
+    market: "StockMarket | None" = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    # Players holding 2+ shares, i.e. eligible for the presidency
+    major_holders: set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Accept a plain dict of holdings and index the major holders."""
+        if not isinstance(self.player_shares, defaultdict):
+            self.player_shares = defaultdict(int, self.player_shares)
+        self.major_holders = {
+            player_id for player_id, shares in self.player_shares.items() if shares >= 2
+        }
 
     @property
     def total_player_shares(self) -> int:
@@ -70,6 +84,11 @@ class Stock:
         """Get number of shares owned by a player."""
         return self.player_shares.get(player_id, 0)
 
+    def has_other_major_holder(self, player_id: str) -> bool:
+        """Check if a player other than player_id holds 2+ shares."""
+        holders = self.major_holders
+        return len(holders) > (player_id in holders)
+
     def get_president(self) -> str | None:
         """Get the player ID with most shares (president)."""
         if not self.player_shares:
@@ -88,8 +107,8 @@ class Stock:
         if count > self.ipo_shares:
             return False
         self.ipo_shares -= count
-        current = self.player_shares.get(player_id, 0)
-        self.player_shares[player_id] = current + count
+        self.player_shares[player_id] += count
+        self._after_trade(player_id)
         return True
 
     def buy_from_market(self, player_id: str, count: int = 1) -> bool:
@@ -97,8 +116,8 @@ class Stock:
         if count > self.market_shares:
             return False
         self.market_shares -= count
-        current = self.player_shares.get(player_id, 0)
-        self.player_shares[player_id] = current + count
+        self.player_shares[player_id] += count
+        self._after_trade(player_id)
         return True
 
     def sell_to_market(self, player_id: str, count: int = 1) -> bool:
@@ -106,12 +125,23 @@ class Stock:
         current = self.player_shares.get(player_id, 0)
         if count > current:
             return False
-        self.player_shares[player_id] = current - count
-        if self.player_shares[player_id] == 0:
-            del self.player_shares[player_id]
+        if current == count:
+            self.player_shares.pop(player_id, None)
+        else:
+            self.player_shares[player_id] = current - count
         self.market_shares += count
+        self._after_trade(player_id)
         return True
 
+    def _after_trade(self, player_id: str) -> None:
+        """Refresh derived holdings and the owning market's indexes."""
+        if self.player_shares.get(player_id, 0) >= 2:
+            self.major_holders.add(player_id)
+        else:
+            self.major_holders.discard(player_id)
+        if self.market is not None:
+            self.market._record_trade(self, player_id)
+
 
 class StockMarket:
     """Manages the stock market for all companies.
@@ -120,13 +150,57 @@ class StockMarket:
         stocks: Dictionary mapping company_id to Stock.
     """
 
+    __slots__ = ("_by_player", "_with_ipo_shares", "_with_market_shares", "stocks")
+
     def __init__(self) -> None:
         """Initialize empty stock market."""
         self.stocks: dict[str, Stock] = {}
+        # Indexes kept in sync by each Stock: player_id -> {company_id: shares},
+        # and the companies with shares left in the IPO / open market
+        self._by_player: dict[str, dict[str, int]] = {}
+        self._with_ipo_shares: set[str] = set()
+        self._with_market_shares: set[str] = set()
+
+    @property
+    def with_ipo_shares(self) -> AbstractSet[str]:
+        """Get IDs of companies with shares remaining in the IPO."""
+        return self._with_ipo_shares
+
+    @property
+    def with_market_shares(self) -> AbstractSet[str]:
+        """Get IDs of companies with shares in the open market."""
+        return self._with_market_shares
 
     def add_company(self, company_id: str) -> None:
         """Add a company's stock to the market."""
-        self.stocks[company_id] = Stock(company_id=company_id)
+        stock = Stock(company_id=company_id)
+        stock.market = self
+        self.stocks[company_id] = stock
+        self._update_pools(stock)
+
+    def _record_trade(self, stock: Stock, player_id: str) -> None:
+        """Update the market's indexes after a share transaction."""
+        company_id = stock.company_id
+        shares = stock.player_shares.get(player_id, 0)
+        if shares:
+            self._by_player.setdefault(player_id, {})[company_id] = shares
+        else:
+            holdings = self._by_player.get(player_id)
+            if holdings:
+                holdings.pop(company_id, None)
+        self._update_pools(stock)
+
+    def _update_pools(self, stock: Stock) -> None:
+        """Track whether a stock has shares in the IPO and open market."""
+        company_id = stock.company_id
+        if stock.ipo_shares > 0:
+            self._with_ipo_shares.add(company_id)
+        else:
+            self._with_ipo_shares.discard(company_id)
+        if stock.market_shares > 0:
+            self._with_market_shares.add(company_id)
+        else:
+            self._with_market_shares.discard(company_id)
 
     def get_stock(self, company_id: str) -> Stock | None:
         """Get stock information for a company."""
@@ -134,16 +208,11 @@ class StockMarket:
 
     def get_player_portfolio(self, player_id: str) -> dict[str, int]:
         """Get all shares owned by a player."""
-        portfolio = {}
-        for company_id, stock in self.stocks.items():
-            shares = stock.get_player_shares(player_id)
-            if shares > 0:
-                portfolio[company_id] = shares
-        return portfolio
+        return dict(self._by_player.get(player_id, {}))
 
     def get_total_shares_owned(self, player_id: str) -> int:
         """Get total number of shares owned by a player."""
-        return sum(self.get_player_portfolio(player_id).values())
+        return sum(self._by_player.get(player_id, {}).values())
 
     def can_buy_share(
         self,
@@ -17,6 +17,10 @@ class TileType(Enum):
     OFFBOARD = "offboard"
 
 
+# Empty, water, and offboard cannot have track
+_NON_TRACK_TILES = frozenset({TileType.EMPTY, TileType.WATER, TileType.OFFBOARD})
+
+
 class TrackDirection(Enum):
     """Directions tracks can connect."""
 
@@ -28,7 +32,7 @@ class TrackDirection(Enum):
     NORTHWEST = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class City:
     """Represents a city on the board.
 
@@ -36,20 +40,23 @@ class City:
         name: Name of the city.
         revenue_values: List of revenue values for different phases.
         station_slots: Number of station token slots.
-        tokens: List of company IDs with tokens here.
+        tokens: Set of company IDs with tokens here.
     """
 
     name: str
     revenue_values: list[int] = field(default_factory=list)
     station_slots: int = 1
-    tokens: list[str] = field(default_factory=list)
+    tokens: set[str] = field(default_factory=set)
 
     def get_revenue(self, phase: int) -> int:
         """Get revenue for current phase."""
-        if not self.revenue_values:
+        values = self.revenue_values
+        if not values:
             return 0
-        index = min(phase - 1, len(self.revenue_values) - 1)
-        return self.revenue_values[index]
+        # Phases past the end of the table keep the last value
+        if phase >= len(values):
+            return values[-1]
+        return values[phase - 1]
 
     def can_place_token(self) -> bool:
         """Check if a token can be placed here."""
@@ -61,7 +68,7 @@ class City:
             return False
         if company_id in self.tokens:
             return False  # Already has token
-        self.tokens.append(company_id)
+        self.tokens.add(company_id)
         return True
 
     def has_token(self, company_id: str) -> bool:
@@ -69,7 +76,7 @@ class City:
         return company_id in self.tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class Tile:
     """Represents a tile on the game board.
 
@@ -81,7 +88,7 @@ class Tile:
         tile_number: The tile number placed here (None if no track).
         rotation: Rotation of tile (0-5).
         cities: List of cities on this tile.
-        track_connections: Set of connected directions.
+        connections: Bitmask of connected directions (bit n is direction n).
         terrain_cost: Extra cost to lay track here.
     """
 
@@ -92,7 +99,7 @@ class Tile:
     tile_number: str | None = None
     rotation: int = 0
     cities: list[City] = field(default_factory=list)
-    track_connections: set[TrackDirection] = field(default_factory=set)
+    connections: int = 0
     terrain_cost: int = 0
 
     @property
@@ -100,13 +107,27 @@ class Tile:
         """Check if this tile has track laid."""
         return self.tile_number is not None
 
+    @property
+    def track_connections(self) -> set[TrackDirection]:
+        """Get the set of connected directions."""
+        return {d for d in TrackDirection if self.connections >> d.value & 1}
+
+    def has_connection(self, direction: TrackDirection) -> bool:
+        """Check if track connects in the given direction."""
+        return bool(self.connections & (1 << direction.value))
+
+    def add_connection(self, direction: TrackDirection) -> None:
+        """Connect track in the given direction."""
+        self.connections |= 1 << direction.value
+
+    def connection_count(self) -> int:
+        """Get the number of connected directions."""
+        return self.connections.bit_count()
+
     @property
     def is_upgradable(self) -> bool:
         """Check if this tile can be upgraded."""
-        # Empty, water, and offboard cannot have track
-        if self.tile_type in (TileType.EMPTY, TileType.WATER, TileType.OFFBOARD):
-            return False
-        return True
+        return self.tile_type not in _NON_TRACK_TILES
 
     def place_tile(self, tile_number: str, rotation: int = 0) -> None:
         """Place a track tile here."""
@@ -122,6 +143,35 @@ class Tile:
 BOARD_ROWS = 9
 BOARD_COLS = 12
 
+# Tile IDs by position (A1, A2, ... I12) and the reverse lookup
+ROW_LABELS = tuple(chr(65 + row) for row in range(BOARD_ROWS))
+TILE_IDS = tuple(
+    tuple(f"{label}{col + 1}" for col in range(BOARD_COLS)) for label in ROW_LABELS
+)
+TILE_POS = {
+    tile_id: (row, col)
+    for row, row_ids in enumerate(TILE_IDS)
+    for col, tile_id in enumerate(row_ids)
+}
+
+# Column header and per-type glyphs for Board.render_ascii
+_ASCII_HEADER = "   " + " ".join(f"{i + 1:2}" for i in range(BOARD_COLS))
+_TYPE_EMOJI = {
+    TileType.CITY: "🏙️",
+    TileType.MOUNTAIN: "⛰️",
+    TileType.WATER: "🌊",
+}
+
+# Hex grid adjacency (simplified for rectangular representation)
+NEIGHBOR_OFFSETS = (
+    (-1, 0),  # North
+    (-1, 1),  # Northeast
+    (0, 1),  # East
+    (1, 0),  # South
+    (1, -1),  # Southwest
+    (0, -1),  # West
+)
+
 # Major cities in 1889 Shikoku
 CITIES_1889 = {
     "Takamatsu": {"revenue": [20, 30, 40, 50], "slots": 2},
@@ -145,10 +195,15 @@ class Board:
         cities: Dictionary of city names to City objects.
     """
 
+    __slots__ = ("_adjacency", "_grid", "cities", "tiles")
+
     def __init__(self) -> None:
         """Initialize the 1889 board."""
         self.tiles: dict[str, Tile] = {}
         self.cities: dict[str, City] = {}
+        # Same tiles in row-major order, indexed by row * BOARD_COLS + col
+        self._grid: list[Tile] = []
+        self._adjacency: dict[str, tuple[Tile, ...]] = {}
         self._initialize_board()
 
     def _initialize_board(self) -> None:
@@ -161,18 +216,21 @@ class Board:
                 station_slots=city_info["slots"],
             )
 
-        # Create basic grid
-        for row in range(BOARD_ROWS):
-            for col in range(BOARD_COLS):
-                tile_id = f"{chr(65 + row)}{col + 1}"  # A1, A2, ... I12
-                # Default to plain terrain
-                tile_type = TileType.PLAIN
-                self.tiles[tile_id] = Tile(
-                    id=tile_id,
-                    tile_type=tile_type,
-                    row=row,
-                    col=col,
-                )
+        # Create basic grid, defaulting to plain terrain
+        self._grid = [
+            Tile(id=tile_id, tile_type=TileType.PLAIN, row=row, col=col)
+            for tile_id, (row, col) in TILE_POS.items()
+        ]
+        self.tiles.update((tile.id, tile) for tile in self._grid)
+
+        # Neighbours never change, so resolve them once
+        grid = self._grid
+        for tile in grid:
+            self._adjacency[tile.id] = tuple(
+                grid[(tile.row + dr) * BOARD_COLS + tile.col + dc]
+                for dr, dc in NEIGHBOR_OFFSETS
+                if 0 <= tile.row + dr < BOARD_ROWS and 0 <= tile.col + dc < BOARD_COLS
+            )
 
     def get_tile(self, tile_id: str) -> Tile | None:
         """Get a tile by its ID."""
@@ -180,29 +238,7 @@ class Board:
 
     def get_adjacent_tiles(self, tile_id: str) -> list[Tile]:
         """Get tiles adjacent to the given tile."""
-        tile = self.tiles.get(tile_id)
-        if not tile:
-            return []
-
-        adjacent = []
-        # Hex grid adjacency (simplified for rectangular representation)
-        offsets = [
-            (-1, 0),  # North
-            (-1, 1),  # Northeast
-            (0, 1),  # East
-            (1, 0),  # South
-            (1, -1),  # Southwest
-            (0, -1),  # West
-        ]
-
-        for dr, dc in offsets:
-            new_row = tile.row + dr
-            new_col = tile.col + dc
-            adj_id = f"{chr(65 + new_row)}{new_col + 1}"
-            if adj_id in self.tiles:
-                adjacent.append(self.tiles[adj_id])
-
-        return adjacent
+        return list(self._adjacency.get(tile_id, ()))
 
     def can_lay_track(self, tile_id: str, company_id: str) -> bool:
         """Check if a company can lay track on a tile."""
@@ -224,28 +260,15 @@ class Board:
 
     def render_ascii(self) -> str:
         """Render the board as ASCII art."""
-        lines = []
-        lines.append("   " + " ".join(f"{i + 1:2}" for i in range(BOARD_COLS)))
-
-        for row in range(BOARD_ROWS):
-            row_char = chr(65 + row)
-            row_tiles = []
-            for col in range(BOARD_COLS):
-                tile_id = f"{row_char}{col + 1}"
-                tile = self.tiles.get(tile_id)
-                if tile:
-                    if tile.has_track:
-                        row_tiles.append("🛤️")
-                    elif tile.tile_type == TileType.CITY:
-                        row_tiles.append("🏙️")
-                    elif tile.tile_type == TileType.MOUNTAIN:
-                        row_tiles.append("⛰️")
-                    elif tile.tile_type == TileType.WATER:
-                        row_tiles.append("🌊")
-                    else:
-                        row_tiles.append("⬜")
-                else:
-                    row_tiles.append("  ")
+        lines = [_ASCII_HEADER]
+
+        grid = self._grid
+        for row, row_char in enumerate(ROW_LABELS):
+            start = row * BOARD_COLS
+            row_tiles = [
+                "🛤️" if tile.has_track else _TYPE_EMOJI.get(tile.tile_type, "⬜")
+                for tile in grid[start : start + BOARD_COLS]
+            ]
             lines.append(f"{row_char}  " + " ".join(row_tiles))
 
         return "\n".join(lines)
@@ -1,6 +1,7 @@
 """Train model for TeleTycoon 1889."""
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -15,60 +16,104 @@ class TrainType(Enum):
     DIESEL = "D"
 
 
+@dataclass(frozen=True, slots=True)
+class TrainSpec:
+    """Static definition of a train type.
+
+    Attributes:
+        name: Display name.
+        cities: Number of cities the train can visit.
+        cost: Purchase cost from the depot.
+        rusts_on: Train type whose purchase rusts this one.
+        quantity: Number of trains of this type in the game.
+        phase: Phase in which this type becomes available.
+    """
+
+    name: str
+    cities: int
+    cost: int
+    rusts_on: TrainType | None
+    quantity: int
+    phase: int
+
+
 # Train definitions for 1889
 TRAIN_DEFINITIONS = {
-    TrainType.TRAIN_2: {
-        "name": "2-Train",
-        "cities": 2,
-        "cost": 80,
-        "rusts_on": TrainType.TRAIN_4,
-        "quantity": 6,
-        "phase": 2,
-    },
-    TrainType.TRAIN_3: {
-        "name": "3-Train",
-        "cities": 3,
-        "cost": 180,
-        "rusts_on": TrainType.TRAIN_6,
-        "quantity": 5,
-        "phase": 3,
-    },
-    TrainType.TRAIN_4: {
-        "name": "4-Train",
-        "cities": 4,
-        "cost": 300,
-        "rusts_on": TrainType.DIESEL,
-        "quantity": 4,
-        "phase": 4,
-    },
-    TrainType.TRAIN_5: {
-        "name": "5-Train",
-        "cities": 5,
-        "cost": 450,
-        "rusts_on": None,
-        "quantity": 3,
-        "phase": 5,
-    },
-    TrainType.TRAIN_6: {
-        "name": "6-Train",
-        "cities": 6,
-        "cost": 630,
-        "rusts_on": None,
-        "quantity": 2,
-        "phase": 6,
-    },
-    TrainType.DIESEL: {
-        "name": "Diesel",
-        "cities": 99,  # Unlimited
-        "cost": 1100,
-        "rusts_on": None,
-        "quantity": 99,  # Unlimited
-        "phase": 7,
-    },
+    TrainType.TRAIN_2: TrainSpec(
+        name="2-Train",
+        cities=2,
+        cost=80,
+        rusts_on=TrainType.TRAIN_4,
+        quantity=6,
+        phase=2,
+    ),
+    TrainType.TRAIN_3: TrainSpec(
+        name="3-Train",
+        cities=3,
+        cost=180,
+        rusts_on=TrainType.TRAIN_6,
+        quantity=5,
+        phase=3,
+    ),
+    TrainType.TRAIN_4: TrainSpec(
+        name="4-Train",
+        cities=4,
+        cost=300,
+        rusts_on=TrainType.DIESEL,
+        quantity=4,
+        phase=4,
+    ),
+    TrainType.TRAIN_5: TrainSpec(
+        name="5-Train",
+        cities=5,
+        cost=450,
+        rusts_on=None,
+        quantity=3,
+        phase=5,
+    ),
+    TrainType.TRAIN_6: TrainSpec(
+        name="6-Train",
+        cities=6,
+        cost=630,
+        rusts_on=None,
+        quantity=2,
+        phase=6,
+    ),
+    TrainType.DIESEL: TrainSpec(
+        name="Diesel",
+        cities=99,  # Unlimited
+        cost=1100,
+        rusts_on=None,
+        quantity=99,  # Unlimited
+        phase=7,
+    ),
 }
 
 
-@dataclass
+# Phase -> most trains a company may own; later phases allow 2
+TRAIN_LIMITS_1889: dict[int, int] = {2: 4, 3: 4, 4: 3, 5: 3}
+
+# Trigger train type -> train types that rust when it is bought
+_RUSTS_WHEN: dict[TrainType, tuple[TrainType, ...]] = {
+    trigger: tuple(
+        train_type
+        for train_type, spec in TRAIN_DEFINITIONS.items()
+        if spec.rusts_on == trigger
+    )
+    for trigger in TrainType
+}
+
+_TRAIN_EMOJI = {
+    TrainType.TRAIN_2: "🚂2️⃣",
+    TrainType.TRAIN_3: "🚂3️⃣",
+    TrainType.TRAIN_4: "🚂4️⃣",
+    TrainType.TRAIN_5: "🚂5️⃣",
+    TrainType.TRAIN_6: "🚂6️⃣",
+    TrainType.DIESEL: "🚃⚡",
+}
+
+
+@dataclass(slots=True)
 class Train:
     """Represents a train in the game.
 
@@ -83,31 +128,36 @@ class Train:
     train_type: TrainType
     owner_id: str | None = None
     rusted: bool = False
+    _definition: TrainSpec = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve this train's definition once."""
+        self._definition = TRAIN_DEFINITIONS[self.train_type]
 
     @property
     def name(self) -> str:
         """Get the display name of this train."""
-        return TRAIN_DEFINITIONS[self.train_type]["name"]
+        return self._definition.name
 
     @property
     def cities(self) -> int:
         """Get number of cities this train can visit."""
-        return TRAIN_DEFINITIONS[self.train_type]["cities"]
+        return self._definition.cities
 
     @property
     def cost(self) -> int:
         """Get the purchase cost of this train type."""
-        return TRAIN_DEFINITIONS[self.train_type]["cost"]
+        return self._definition.cost
 
     @property
     def rusts_on(self) -> TrainType | None:
         """Get the train type that causes this train to rust."""
-        return TRAIN_DEFINITIONS[self.train_type]["rusts_on"]
+        return self._definition.rusts_on
 
     @property
     def phase(self) -> int:
         """Get the phase this train type is available."""
-        return TRAIN_DEFINITIONS[self.train_type]["phase"]
+        return self._definition.phase
 
     def should_rust(self, new_train_type: TrainType) -> bool:
         """Check if this train should rust when a new train type is bought."""
@@ -120,15 +170,7 @@ class Train:
 
     def emoji(self) -> str:
         """Get emoji representation of this train."""
-        emoji_map = {
-            TrainType.TRAIN_2: "🚂2️⃣",
-            TrainType.TRAIN_3: "🚂3️⃣",
-            TrainType.TRAIN_4: "🚂4️⃣",
-            TrainType.TRAIN_5: "🚂5️⃣",
-            TrainType.TRAIN_6: "🚂6️⃣",
-            TrainType.DIESEL: "🚃⚡",
-        }
-        return emoji_map.get(self.train_type, "🚂")
+        return _TRAIN_EMOJI.get(self.train_type, "🚂")
 
 
 class TrainDepot:
@@ -139,17 +181,33 @@ class TrainDepot:
         current_phase: Current game phase (affects available trains).
     """
 
+    __slots__ = (
+        "_available_by_type",
+        "_next_train_id",
+        "_trains_by_type",
+        "current_phase",
+        "trains",
+    )
+
     def __init__(self) -> None:
         """Initialize the train depot with all trains."""
         self.trains: list[Train] = []
         self.current_phase: int = 2
         self._next_train_id: int = 1
+        # Every train of each type, and the unowned, unrusted ones in
+        # purchase order
+        self._trains_by_type: dict[TrainType, list[Train]] = {
+            train_type: [] for train_type in TrainType
+        }
+        self._available_by_type: dict[TrainType, deque[Train]] = {
+            train_type: deque() for train_type in TrainType
+        }
         self._initialize_trains()
 
     def _initialize_trains(self) -> None:
         """Create all trains for the game."""
         for train_type, definition in TRAIN_DEFINITIONS.items():
-            quantity = definition["quantity"]
+            quantity = definition.quantity
             # Don't create infinite diesel trains upfront
             if train_type == TrainType.DIESEL:
                 quantity = 10  # Reasonable number for diesel
@@ -160,52 +218,74 @@ class TrainDepot:
                 )
                 self._next_train_id += 1
                 self.trains.append(train)
+                self._trains_by_type[train_type].append(train)
+                self._available_by_type[train_type].append(train)
 
-    def get_available_trains(self) -> list[Train]:
-        """Get trains available for purchase in current phase."""
-        available = []
+    def rebuild_index(self) -> None:
+        """Rebuild the per-type availability index from the train list.
+
+        Call this after setting train ownership or rust status directly,
+        e.g. when restoring a saved game.
+        """
+        for queue in self._available_by_type.values():
+            queue.clear()
         for train in self.trains:
             if train.owner_id is None and not train.rusted:
-                if train.phase <= self.current_phase:
-                    available.append(train)
-        return available
+                self._available_by_type[train.train_type].append(train)
+
+    def available_count(self, train_type: TrainType) -> int:
+        """Get the number of unowned trains of a type left in the depot."""
+        return len(self._available_by_type[train_type])
+
+    @property
+    def train_limit(self) -> int:
+        """Get the most trains a company may own in the current phase."""
+        return TRAIN_LIMITS_1889.get(self.current_phase, 2)
+
+    def get_available_trains(self) -> list[Train]:
+        """Get trains available for purchase in current phase."""
+        return [
+            train
+            for train_type, queue in self._available_by_type.items()
+            if TRAIN_DEFINITIONS[train_type].phase <= self.current_phase
+            for train in queue
+        ]
 
     def get_next_available_train_type(self) -> TrainType | None:
         """Get the type of the next train available for purchase."""
-        available = self.get_available_trains()
-        if available:
-            return available[0].train_type
+        for train_type, queue in self._available_by_type.items():
+            if queue and TRAIN_DEFINITIONS[train_type].phase <= self.current_phase:
+                return train_type
         return None
 
     def buy_train(self, train_type: TrainType, company_id: str) -> Train | None:
         """Buy a train from the depot for a company."""
-        for train in self.trains:
-            if (
-                train.train_type == train_type
-                and train.owner_id is None
-                and not train.rusted
-            ):
-                train.owner_id = company_id
-                # Check if this advances the phase
-                self._check_phase_advance(train_type)
-                return train
-        return None
+        queue = self._available_by_type.get(train_type)
+        if not queue:
+            return None
+        train = queue.popleft()
+        train.owner_id = company_id
+        # Check if this advances the phase
+        self._check_phase_advance(train_type)
+        return train
 
     def _check_phase_advance(self, bought_type: TrainType) -> None:
         """Check if buying a train advances the phase."""
-        train_phase = TRAIN_DEFINITIONS[bought_type]["phase"]
+        train_phase = TRAIN_DEFINITIONS[bought_type].phase
         if train_phase > self.current_phase:
             self.current_phase = train_phase
 
     def rust_trains(self, trigger_type: TrainType) -> list[Train]:
         """Rust all trains that should rust when trigger_type is bought."""
         rusted_trains = []
-        for train in self.trains:
-            if not train.rusted and train.should_rust(trigger_type):
-                train.rust()
-                rusted_trains.append(train)
+        for train_type in _RUSTS_WHEN[trigger_type]:
+            for train in self._trains_by_type[train_type]:
+                if not train.rusted:
+                    train.rust()
+                    rusted_trains.append(train)
+            self._available_by_type[train_type].clear()
         return rusted_trains
 
     def get_train_cost(self, train_type: TrainType) -> int:
         """Get the cost of a train type."""
-        return TRAIN_DEFINITIONS[train_type]["cost"]
+        return TRAIN_DEFINITIONS[train_type].cost
@@ -5,6 +5,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from teletycoon.models.game_state import GameState
 
+# Station slot gauges keyed by (slots, used)
+_SLOT_DISPLAY = {
+    (slots, used): "●" * used + "○" * (slots - used)
+    for slots in range(1, 4)
+    for used in range(slots + 1)
+}
+
 
 class BoardRenderer:
     """Renders the game board for display.
@@ -43,7 +50,7 @@ class BoardRenderer:
         cities_with_tokens = []
         for city_name, city in self.state.board.cities.items():
             if city.tokens:
-                token_str = ", ".join(city.tokens)
+                token_str = ", ".join(sorted(city.tokens))
                 cities_with_tokens.append(f"  {city_name}: {token_str}")
 
         if cities_with_tokens:
@@ -122,8 +129,10 @@ class BoardRenderer:
             used = len(city.tokens)
             revenue = city.get_revenue(self.state.phase_number)
 
-            slot_display = "●" * used + "○" * (slots - used)
-            token_list = ", ".join(city.tokens) if city.tokens else "empty"
+            slot_display = _SLOT_DISPLAY.get((slots, used))
+            if slot_display is None:
+                slot_display = "●" * used + "○" * (slots - used)
+            token_list = ", ".join(sorted(city.tokens)) if city.tokens else "empty"
 
             lines.append(f"  {city_name} [{slot_display}] ¥{revenue}: {token_list}")
 
@@ -178,10 +187,10 @@ class BoardRenderer:
             return "❓ One or both cities not found"
 
         # For now, assume connected if both have tokens from same company
-        shared = set(city_a.tokens) & set(city_b.tokens)
+        shared = city_a.tokens & city_b.tokens
 
         if shared:
-            companies = ", ".join(shared)
+            companies = ", ".join(sorted(shared))
             return f"🔗 {from_city} ↔ {to_city}: Connected via {companies}"
         else:
             return f"❌ {from_city} ↔ {to_city}: Not connected"
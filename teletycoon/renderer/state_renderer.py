@@ -2,12 +2,27 @@
 
 from typing import TYPE_CHECKING
 
+from teletycoon.models.train import TRAIN_DEFINITIONS
+
 if TYPE_CHECKING:
     from teletycoon.models.game_state import GameState
 
 from .board_renderer import BoardRenderer
 from .stock_renderer import StockRenderer
 
+_ACTION_EMOJI = {
+    "start_company": "🏢",
+    "buy_ipo": "📈",
+    "buy_market": "🛒",
+    "sell": "📉",
+    "pass": "⏭️",
+    "lay_track": "🛤️",
+    "place_token": "📍",
+    "run_trains": "🚂",
+    "buy_train": "🚃",
+    "done": "✅",
+}
+
 
 class StateRenderer:
     """Main renderer for game state visualization.
@@ -76,12 +91,11 @@ class StateRenderer:
         """Render player cash information."""
         lines = ["💰 Player Cash:"]
 
-        for player_id in self.state.player_order:
-            player = self.state.players.get(player_id)
-            if player:
-                indicator = "👑" if player.priority_deal else "  "
-                passed = "✓" if player_id in self.state.passed_players else " "
-                lines.append(f"{indicator} {player.name}: ¥{player.cash} {passed}")
+        passed_players = self.state.passed_players
+        for player in self.state.players_in_order:
+            indicator = "👑" if player.priority_deal else "  "
+            passed = "✓" if player.id in passed_players else " "
+            lines.append(f"{indicator} {player.name}: ¥{player.cash} {passed}")
 
         return "\n".join(lines)
 
@@ -89,17 +103,13 @@ class StateRenderer:
         """Render company information."""
         lines = ["🚂 Companies:"]
 
-        from teletycoon.models.company import CompanyStatus
-
-        active = [
-            c for c in self.state.companies.values() if c.status == CompanyStatus.ACTIVE
-        ]
+        active = self.state.active_companies_by_price
 
         if not active:
             lines.append("  No companies started yet")
             return "\n".join(lines)
 
-        for company in sorted(active, key=lambda c: c.stock_price, reverse=True):
+        for company in active:
             president = self.state.players.get(company.president_id or "")
             pres_name = president.name if president else "None"
 
@@ -116,17 +126,13 @@ class StateRenderer:
 
     def _render_company_summary(self) -> str:
         """Render brief company summary."""
-        from teletycoon.models.company import CompanyStatus
-
-        active = [
-            c for c in self.state.companies.values() if c.status == CompanyStatus.ACTIVE
-        ]
+        active = self.state.active_companies_by_price
         if not active:
             return "🚂 No companies started"
 
         parts = []
-        for c in sorted(active, key=lambda x: x.stock_price, reverse=True):
-            parts.append(f"{c.color}{c.id}:¥{c.stock_price}")
+        for c in active:
+            parts.append(f"{c.label}:¥{c.stock_price}")
 
         return "🚂 " + " | ".join(parts)
 
@@ -134,29 +140,20 @@ class StateRenderer:
         """Render train availability information."""
         lines = ["🚃 Train Depot:"]
 
-        available = self.state.train_depot.get_available_trains()
-        if not available:
-            lines.append("  No trains available")
-            return "\n".join(lines)
-
-        # Group by type
-        from collections import Counter
-
-        type_counts: Counter[str] = Counter()
-        for train in available:
-            type_counts[train.train_type.value] += 1
-
-        from teletycoon.models.train import TRAIN_DEFINITIONS, TrainType
-
-        for train_type in TrainType:
-            if train_type.value in type_counts:
-                count = type_counts[train_type.value]
-                cost = TRAIN_DEFINITIONS[train_type]["cost"]
-                cities = TRAIN_DEFINITIONS[train_type]["cities"]
+        depot = self.state.train_depot
+        phase = depot.current_phase
+        for train_type, definition in TRAIN_DEFINITIONS.items():
+            if definition.phase > phase:
+                continue
+            count = depot.available_count(train_type)
+            if count:
                 lines.append(
-                    f"  {train_type.value}-train: {count} available | ¥{cost} | {cities} cities"
+                    f"  {train_type.value}-train: {count} available | ¥{definition.cost} | {definition.cities} cities"
                 )
 
+        if len(lines) == 1:
+            lines.append("  No trains available")
+
         return "\n".join(lines)
 
     def _render_turn_info(self) -> str:
@@ -243,19 +240,7 @@ class StateRenderer:
 
     def _action_emoji(self, action_type: str) -> str:
         """Get emoji for action type."""
-        emojis = {
-            "start_company": "🏢",
-            "buy_ipo": "📈",
-            "buy_market": "🛒",
-            "sell": "📉",
-            "pass": "⏭️",
-            "lay_track": "🛤️",
-            "place_token": "📍",
-            "run_trains": "🚂",
-            "buy_train": "🚃",
-            "done": "✅",
-        }
-        return emojis.get(action_type, "▪️")
+        return _ACTION_EMOJI.get(action_type, "▪️")
 
     def render_action_result(self, result: dict) -> str:
         """Render the result of an action.
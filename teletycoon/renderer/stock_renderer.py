@@ -2,6 +2,12 @@
 
 from typing import TYPE_CHECKING
 
+from teletycoon.models.company import (
+    LAST_PRICE_INDEX,
+    STOCK_PRICES_1889,
+    CompanyStatus,
+)
+
 if TYPE_CHECKING:
     from teletycoon.models.game_state import GameState
 
@@ -39,49 +45,47 @@ class StockRenderer:
         lines.append(header)
         lines.append("-" * len(header))
 
-        from teletycoon.models.company import CompanyStatus
-
-        # Company rows
-        for company_id, company in sorted(
-            self.state.companies.items(),
-            key=lambda x: x[1].stock_price
-            if x[1].status == CompanyStatus.ACTIVE
-            else 0,
-            reverse=True,
-        ):
-            if company.status != CompanyStatus.ACTIVE:
-                continue
-
-            stock = self.state.stock_market.get_stock(company_id)
+        # Company rows share one template, built once for this player count
+        player_order = self.state.player_order
+        row_template = "{}{:3} | ¥{:3} |  {:2} |  {:2} | " + " | ".join(
+            ["{}"] * len(player_order)
+        )
+        for company in self.state.active_companies_by_price:
+            stock = self.state.stock_market.get_stock(company.id)
             if not stock:
                 continue
 
-            player_shares = []
-            for player_id in self.state.player_order:
-                shares = stock.get_player_shares(player_id)
-                pres = "P" if company.president_id == player_id else " "
-                player_shares.append(f"{shares}{pres}" if shares else "  ")
-
-            row = (
-                f"{company.color}{company.id:3} | "
-                f"¥{company.stock_price:3} | "
-                f" {stock.ipo_shares:2} | "
-                f" {stock.market_shares:2} | "
-                + " | ".join(f"{s:>2}" for s in player_shares)
+            shares_of = stock.player_shares.get
+            president_id = company.president_id
+            share_cells = []
+            for player_id in player_order:
+                shares = shares_of(player_id)
+                if shares:
+                    pres = "P" if player_id == president_id else " "
+                    share_cells.append(f"{shares}{pres}")
+                else:
+                    share_cells.append("  ")
+
+            lines.append(
+                row_template.format(
+                    company.color,
+                    company.id,
+                    company.stock_price,
+                    stock.ipo_shares,
+                    stock.market_shares,
+                    *share_cells,
+                )
             )
-            lines.append(row)
 
         # Unstarted companies
         unstarted = [
             c
             for c in self.state.companies.values()
-            if c.status == CompanyStatus.UNSTARTED
+            if c.status is CompanyStatus.UNSTARTED
         ]
         if unstarted:
             lines.append("")
-            lines.append(
-                "Not Started: " + ", ".join(f"{c.color}{c.id}" for c in unstarted)
-            )
+            lines.append("Not Started: " + ", ".join(c.label for c in unstarted))
 
         return "\n".join(lines)
 
@@ -103,28 +107,21 @@ class StockRenderer:
         lines.append("")
 
         total_value = player.cash
-        holdings = []
-
-        for company_id, company in self.state.companies.items():
-            stock = self.state.stock_market.get_stock(company_id)
-            if not stock:
-                continue
-
-            shares = stock.get_player_shares(player_id)
-            if shares > 0:
-                value = shares * company.stock_price
-                pres = " (President)" if company.president_id == player_id else ""
-                holdings.append(
-                    f"  {company.color} {company.id}: {shares} shares × "
-                    f"¥{company.stock_price} = ¥{value}{pres}"
-                )
-                total_value += value
-
-        if holdings:
-            lines.append("📈 Holdings:")
-            lines.extend(holdings)
-        else:
+        holdings = self.state.stock_market.get_player_portfolio(player_id)
+        if not holdings:
             lines.append("📈 No stock holdings")
+        else:
+            lines.append("📈 Holdings:")
+            for company_id, company in self.state.companies.items():
+                shares = holdings.get(company_id, 0)
+                if shares > 0:
+                    value = shares * company.stock_price
+                    pres = " (President)" if company.president_id == player_id else ""
+                    lines.append(
+                        f"  {company.color} {company.id}: {shares} shares × "
+                        f"¥{company.stock_price} = ¥{value}{pres}"
+                    )
+                    total_value += value
 
         lines.append("")
         lines.append(f"💰 Total Value: ¥{total_value}")
@@ -177,20 +174,19 @@ class StockRenderer:
         """
         lines = ["🛒 Open Market:"]
 
-        available = []
+        market = self.state.stock_market
+        with_market = market.with_market_shares
+        if not with_market:
+            lines.append("  No shares available in market")
+            return "\n".join(lines)
+
         for company_id, company in self.state.companies.items():
-            stock = self.state.stock_market.get_stock(company_id)
-            if stock and stock.market_shares > 0:
-                available.append(
-                    f"  {company.color}{company_id}: {stock.market_shares} "
-                    f"@ ¥{company.stock_price}"
+            if company_id in with_market:
+                stock = market.stocks[company_id]
+                lines.append(
+                    f"  {company.label}: {stock.market_shares} @ ¥{company.stock_price}"
                 )
 
-        if available:
-            lines.extend(available)
-        else:
-            lines.append("  No shares available in market")
-
         return "\n".join(lines)
 
     def render_ipo_summary(self) -> str:
@@ -201,22 +197,22 @@ class StockRenderer:
         """
         lines = ["📦 IPO Shares:"]
 
+        market = self.state.stock_market
+        with_ipo = market.with_ipo_shares
+        if not with_ipo:
+            return "\n".join(lines)
+
         for company_id, company in self.state.companies.items():
-            stock = self.state.stock_market.get_stock(company_id)
-            if not stock:
+            if company_id not in with_ipo:
                 continue
 
-            if stock.ipo_shares > 0:
-                if company.is_floated:
-                    lines.append(
-                        f"  {company.color}{company_id}: {stock.ipo_shares} "
-                        f"@ ¥{company.stock_price}"
-                    )
-                else:
-                    lines.append(
-                        f"  {company.color}{company_id}: {stock.ipo_shares} "
-                        f"(not started)"
-                    )
+            stock = market.stocks[company_id]
+            if company.is_floated:
+                lines.append(
+                    f"  {company.label}: {stock.ipo_shares} @ ¥{company.stock_price}"
+                )
+            else:
+                lines.append(f"  {company.label}: {stock.ipo_shares} (not started)")
 
         return "\n".join(lines)
 
@@ -226,8 +222,6 @@ class StockRenderer:
         Returns:
             Stock price chart visualization.
         """
-        from teletycoon.models.company import STOCK_PRICES_1889
-
         lines = ["📈 Stock Price Chart:"]
 
         # Show relevant portion of chart with company positions
@@ -242,10 +236,7 @@ class StockRenderer:
         # Display chart (simplified - show around active prices)
         if company_positions:
             min_idx = max(0, min(company_positions.keys()) - 2)
-            max_idx = min(
-                len(STOCK_PRICES_1889) - 1,
-                max(company_positions.keys()) + 2,
-            )
+            max_idx = min(LAST_PRICE_INDEX, max(company_positions.keys()) + 2)
 
             for idx in range(min_idx, max_idx + 1):
                 price = STOCK_PRICES_1889[idx]
@@ -271,20 +262,7 @@ class StockRenderer:
         if not player:
             return f"Player {player_id} not found"
 
-        count = 0
-        for company_id in self.state.companies:
-            stock = self.state.stock_market.get_stock(company_id)
-            if stock:
-                shares = stock.get_player_shares(player_id)
-                if shares > 0:
-                    company = self.state.companies[company_id]
-                    if company.president_id == player_id:
-                        count += 1 + max(0, shares - 2)
-                    else:
-                        count += shares
-
-        # Get limit
-        limits = {2: 28, 3: 20, 4: 16, 5: 13, 6: 11}
-        limit = limits.get(len(self.state.players), 16)
+        count = self.state.count_certificates(player_id)
+        limit = self.state.cert_limit
 
         return f"📜 {player.name}: {count}/{limit} certificates"
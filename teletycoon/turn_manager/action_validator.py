@@ -1,5 +1,6 @@
 """Action validator for TeleTycoon."""
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -10,6 +11,12 @@ from teletycoon.models.company import PAR_VALUES_1889, CompanyStatus
 from teletycoon.models.game_state import GamePhase, RoundType
 from teletycoon.models.train import TRAIN_DEFINITIONS, TrainType
 
+# Validation results shared by several validators
+_OK = (True, "")
+_ERR_COMPANY_ID_REQUIRED = (False, "Company ID required")
+_ERR_COMPANY_NOT_FOUND = (False, "Company not found")
+_ERR_CERT_LIMIT = (False, "At certificate limit")
+
 
 class ActionValidator:
     """Validates player actions for legality.
@@ -25,6 +32,23 @@ class ActionValidator:
             state: The game state to validate against.
         """
         self.state = state
+        # Action type -> validator, for actions that need more than a turn check
+        self._stock_validators: dict[
+            str, Callable[[Player, dict[str, Any]], tuple[bool, str]]
+        ] = {
+            "start_company": self._validate_start_company,
+            "buy_ipo": self._validate_buy_ipo,
+            "buy_market": self._validate_buy_market,
+            "sell": self._validate_sell,
+        }
+        self._operating_validators: dict[
+            str, Callable[[Any, dict[str, Any]], tuple[bool, str]]
+        ] = {
+            "lay_track": self._validate_lay_track,
+            "place_token": self._validate_place_token,
+            "run_trains": self._validate_run_trains,
+            "buy_train": self._validate_buy_train,
+        }
 
     def validate_action(
         self, player_id: str, action: dict[str, Any]
@@ -39,14 +63,14 @@ class ActionValidator:
             Tuple of (is_valid, error_message).
         """
         # Check game phase
-        if self.state.current_phase == GamePhase.GAME_END:
+        if self.state.current_phase is GamePhase.GAME_END:
             return False, "Game has ended"
 
-        if self.state.current_phase == GamePhase.SETUP:
+        if self.state.current_phase is GamePhase.SETUP:
             return False, "Game has not started"
 
         # Route to appropriate validator
-        if self.state.round_type == RoundType.STOCK:
+        if self.state.round_type is RoundType.STOCK:
             return self._validate_stock_action(player_id, action)
         else:
             return self._validate_operating_action(player_id, action)
@@ -71,19 +95,11 @@ class ActionValidator:
         action_type = action.get("type")
 
         if action_type == "pass":
-            return True, ""
-
-        elif action_type == "start_company":
-            return self._validate_start_company(player, action)
-
-        elif action_type == "buy_ipo":
-            return self._validate_buy_ipo(player, action)
+            return _OK
 
-        elif action_type == "buy_market":
-            return self._validate_buy_market(player, action)
-
-        elif action_type == "sell":
-            return self._validate_sell(player, action)
+        validator = self._stock_validators.get(action_type)
+        if validator:
+            return validator(player, action)
 
         return False, f"Unknown action type: {action_type}"
 
@@ -95,11 +111,11 @@ class ActionValidator:
         par_value = action.get("par_value", 65)
 
         if not company_id:
-            return False, "Company ID required"
+            return _ERR_COMPANY_ID_REQUIRED
 
         company = self.state.companies.get(company_id)
         if not company:
-            return False, "Company not found"
+            return _ERR_COMPANY_NOT_FOUND
 
         if company.status != CompanyStatus.UNSTARTED:
             return False, "Company already started"
@@ -108,14 +124,14 @@ class ActionValidator:
             return False, f"Invalid par value: {par_value}"
 
         cost = par_value * 2  # President's certificate is 2 shares
-        if not player.can_afford(cost):
+        if player.cash < cost:
             return False, f"Cannot afford ¥{cost}"
 
         # Check certificate limit
         if not self._check_certificate_limit(player.id, 1):
-            return False, "At certificate limit"
+            return _ERR_CERT_LIMIT
 
-        return True, ""
+        return _OK
 
     def _validate_buy_ipo(
         self, player: "Player", action: dict[str, Any]
@@ -124,13 +140,14 @@ class ActionValidator:
         company_id = action.get("company_id")
 
         if not company_id:
-            return False, "Company ID required"
+            return _ERR_COMPANY_ID_REQUIRED
 
-        company = self.state.companies.get(company_id)
-        stock = self.state.stock_market.get_stock(company_id)
+        state = self.state
+        company = state.companies.get(company_id)
+        stock = state.stock_market.stocks.get(company_id)
 
         if not company or not stock:
-            return False, "Company not found"
+            return _ERR_COMPANY_NOT_FOUND
 
         if company.status == CompanyStatus.UNSTARTED:
             return False, "Company not yet started"
@@ -138,13 +155,14 @@ class ActionValidator:
         if stock.ipo_shares <= 0:
             return False, "No shares available in IPO"
 
-        if not player.can_afford(company.stock_price):
-            return False, f"Cannot afford ¥{company.stock_price}"
+        price = company.stock_price
+        if player.cash < price:
+            return False, f"Cannot afford ¥{price}"
 
         if not self._check_certificate_limit(player.id, 1):
-            return False, "At certificate limit"
+            return _ERR_CERT_LIMIT
 
-        return True, ""
+        return _OK
 
     def _validate_buy_market(
         self, player: "Player", action: dict[str, Any]
@@ -153,24 +171,26 @@ class ActionValidator:
         company_id = action.get("company_id")
 
         if not company_id:
-            return False, "Company ID required"
+            return _ERR_COMPANY_ID_REQUIRED
 
-        company = self.state.companies.get(company_id)
-        stock = self.state.stock_market.get_stock(company_id)
+        state = self.state
+        company = state.companies.get(company_id)
+        stock = state.stock_market.stocks.get(company_id)
 
         if not company or not stock:
-            return False, "Company not found"
+            return _ERR_COMPANY_NOT_FOUND
 
         if stock.market_shares <= 0:
             return False, "No shares available in market"
 
-        if not player.can_afford(company.stock_price):
-            return False, f"Cannot afford ¥{company.stock_price}"
+        price = company.stock_price
+        if player.cash < price:
+            return False, f"Cannot afford ¥{price}"
 
         if not self._check_certificate_limit(player.id, 1):
-            return False, "At certificate limit"
+            return _ERR_CERT_LIMIT
 
-        return True, ""
+        return _OK
 
     def _validate_sell(
         self, player: "Player", action: dict[str, Any]
@@ -180,16 +200,17 @@ class ActionValidator:
         count = action.get("count", 1)
 
         if not company_id:
-            return False, "Company ID required"
+            return _ERR_COMPANY_ID_REQUIRED
 
-        company = self.state.companies.get(company_id)
-        stock = self.state.stock_market.get_stock(company_id)
+        state = self.state
+        company = state.companies.get(company_id)
+        stock = state.stock_market.stocks.get(company_id)
 
         if not company or not stock:
-            return False, "Company not found"
+            return _ERR_COMPANY_NOT_FOUND
 
         # Cannot sell in first stock round
-        if self.state.stock_round_number == 1:
+        if state.stock_round_number == 1:
             return False, "Cannot sell in first stock round"
 
         player_shares = stock.get_player_shares(player.id)
@@ -199,17 +220,11 @@ class ActionValidator:
         # Check president rules
         if company.president_id == player.id:
             remaining = player_shares - count
-            if remaining < 2:
-                # Need someone else with 2+ shares
-                has_successor = False
-                for other_id, other_shares in stock.player_shares.items():
-                    if other_id != player.id and other_shares >= 2:
-                        has_successor = True
-                        break
-                if not has_successor:
-                    return False, "Cannot dump presidency without successor"
-
-        return True, ""
+            # Need someone else with 2+ shares
+            if remaining < 2 and not stock.has_other_major_holder(player.id):
+                return False, "Cannot dump presidency without successor"
+
+        return _OK
 
     def _validate_operating_action(
         self, player_id: str, action: dict[str, Any]
@@ -226,19 +241,11 @@ class ActionValidator:
         action_type = action.get("type")
 
         if action_type == "done":
-            return True, ""
-
-        elif action_type == "lay_track":
-            return self._validate_lay_track(company, action)
-
-        elif action_type == "place_token":
-            return self._validate_place_token(company, action)
-
-        elif action_type == "run_trains":
-            return self._validate_run_trains(company, action)
+            return _OK
 
-        elif action_type == "buy_train":
-            return self._validate_buy_train(company, action)
+        validator = self._operating_validators.get(action_type)
+        if validator:
+            return validator(company, action)
 
         return False, f"Unknown action type: {action_type}"
 
@@ -250,7 +257,7 @@ class ActionValidator:
         tiles = action.get("tiles", [])
         if len(tiles) > 2:
             return False, "Cannot lay more than 2 tiles"
-        return True, ""
+        return _OK
 
     def _validate_place_token(
         self, company: Any, action: dict[str, Any]
@@ -269,7 +276,7 @@ class ActionValidator:
             if city.has_token(company.id):
                 return False, "Already have token in city"
 
-        return True, ""
+        return _OK
 
     def _validate_run_trains(
         self, company: Any, action: dict[str, Any]
@@ -277,7 +284,7 @@ class ActionValidator:
         """Validate train running."""
         if not company.trains:
             return False, "No trains to run"
-        return True, ""
+        return _OK
 
     def _validate_buy_train(
         self, company: Any, action: dict[str, Any]
@@ -297,30 +304,25 @@ class ActionValidator:
             return False, "Train type not found"
 
         # Check phase
-        if train_def["phase"] > self.state.train_depot.current_phase:
+        depot = self.state.train_depot
+        if train_def.phase > depot.current_phase:
             return False, "Train not yet available"
 
         # Check availability
-        available = [
-            t
-            for t in self.state.train_depot.trains
-            if t.train_type == train_type and t.owner_id is None and not t.rusted
-        ]
-        if not available:
+        if not depot.available_count(train_type):
             return False, "No trains of this type available"
 
         # Check train limit
-        phase = self.state.train_depot.current_phase
-        limit = 4 if phase <= 3 else 3 if phase <= 5 else 2
+        limit = depot.train_limit
         if len(company.trains) >= limit:
             return False, f"At train limit ({limit})"
 
         # Check treasury
-        cost = train_def["cost"]
+        cost = train_def.cost
         if company.treasury < cost:
             return False, f"Cannot afford ¥{cost}"
 
-        return True, ""
+        return _OK
 
     def _check_certificate_limit(self, player_id: str, additional: int = 0) -> bool:
         """Check if player is within certificate limit.
@@ -332,24 +334,8 @@ class ActionValidator:
         Returns:
             True if within limit.
         """
-        # Certificate limits by player count
-        limits = {2: 28, 3: 20, 4: 16, 5: 13, 6: 11}
-        limit = limits.get(len(self.state.players), 16)
-
-        current = 0
-        for company_id in self.state.companies:
-            stock = self.state.stock_market.get_stock(company_id)
-            if stock:
-                shares = stock.get_player_shares(player_id)
-                if shares > 0:
-                    company = self.state.companies[company_id]
-                    if company.president_id == player_id:
-                        current += 1  # President cert = 1
-                        current += max(0, shares - 2)
-                    else:
-                        current += shares
-
-        return current + additional <= limit
+        current = self.state.count_certificates(player_id)
+        return current + additional <= self.state.cert_limit
 
     def get_validation_errors(
         self, player_id: str, action: dict[str, Any]
@@ -1,6 +1,8 @@
 """Turn manager for TeleTycoon game flow control."""
 
 import logging
+from collections.abc import Callable
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -19,6 +21,8 @@ class TurnManager:
         state: Reference to game state.
     """
 
+    __slots__ = ("_advance_by_round", "logger", "state")
+
     def __init__(self, state: "GameState") -> None:
         """Initialize turn manager.
 
@@ -27,6 +31,11 @@ class TurnManager:
         """
         self.state = state
         self.logger = logging.getLogger(__name__)
+        # Round type -> turn advancer
+        self._advance_by_round: dict[RoundType, Callable[[], str | None]] = {
+            RoundType.STOCK: self._advance_stock_round_turn,
+            RoundType.OPERATING: self._advance_operating_round_turn,
+        }
 
     def get_current_player_id(self) -> str | None:
         """Get the ID of the current player.
@@ -34,11 +43,11 @@ class TurnManager:
         Returns:
             Current player ID or None if no current player.
         """
-        if not self.state.player_order:
+        state = self.state
+        try:
+            return state.player_order[state.current_player_index]
+        except IndexError:
             return None
-        if self.state.current_player_index >= len(self.state.player_order):
-            return None
-        return self.state.player_order[self.state.current_player_index]
 
     def is_player_turn(self, player_id: str) -> bool:
         """Check if it's a specific player's turn.
@@ -59,36 +68,30 @@ class TurnManager:
         Returns:
             ID of the new current player, or None if round ended.
         """
-        if self.state.round_type == RoundType.STOCK:
-            return self._advance_stock_round_turn()
-        else:
-            return self._advance_operating_round_turn()
+        return self._advance_by_round[self.state.round_type]()
 
     def _advance_stock_round_turn(self) -> str | None:
         """Advance turn during stock round."""
-        # Move to next player
-        self.state.current_player_index = (self.state.current_player_index + 1) % len(
-            self.state.player_order
+        state = self.state
+        order = state.player_order
+        n = len(order)
+        passed = state.passed_players
+
+        # Move to next player, skipping passed players (wrapping once)
+        start = (state.current_player_index + 1) % n
+        state.actions_this_turn = 0
+        idx = next(
+            (i for i in chain(range(start, n), range(start)) if order[i] not in passed),
+            start,
         )
-        self.state.actions_this_turn = 0
-
-        # Skip passed players
-        attempts = 0
-        while (
-            self.get_current_player_id() in self.state.passed_players
-            and attempts < len(self.state.player_order)
-        ):
-            self.state.current_player_index = (
-                self.state.current_player_index + 1
-            ) % len(self.state.player_order)
-            attempts += 1
+        state.current_player_index = idx
 
         # Check if everyone has passed
-        if self.state.all_players_passed():
+        if state.all_players_passed():
             self._end_stock_round()
             return None
 
-        return self.get_current_player_id()
+        return order[idx]
 
     def _advance_operating_round_turn(self) -> str | None:
         """Advance turn during operating round.
@@ -98,11 +101,10 @@ class TurnManager:
         """
         # The current company should be marked as operated
         # and we move to the next unoperated company
-        active = self.state.active_companies
-        for company in sorted(active, key=lambda c: c.stock_price, reverse=True):
-            if not company.operated_this_round:
-                # Return the president of this company
-                return company.president_id
+        company = self.state.operating_company
+        if company is not None:
+            # Return the president of this company
+            return company.president_id
 
         # All companies operated - end the operating round
         self._end_operating_round()
@@ -164,10 +166,10 @@ class TurnManager:
         Returns:
             True if player can take action.
         """
-        if self.state.current_phase == GamePhase.GAME_END:
+        if self.state.current_phase is GamePhase.GAME_END:
             return False
 
-        if self.state.round_type == RoundType.STOCK:
+        if self.state.round_type is RoundType.STOCK:
             return self.is_player_turn(player_id)
         else:
             # In operating round, check if player is president of operating company
@@ -185,13 +187,14 @@ class TurnManager:
         Returns:
             Result of handling the timeout.
         """
-        if not self.is_player_turn(player_id):
+        if self.get_current_player_id() != player_id:
             return {"success": False, "error": "Not this player's turn"}
 
-        if self.state.round_type == RoundType.STOCK:
+        state = self.state
+        if state.round_type is RoundType.STOCK:
             # Auto-pass in stock round
             self.mark_player_passed(player_id)
-            self.advance_turn()
+            self._advance_stock_round_turn()
             return {
                 "success": True,
                 "action": "auto_pass",
@@ -199,10 +202,10 @@ class TurnManager:
             }
         else:
             # In operating round, auto-complete
-            company = self.state.operating_company
+            company = state.operating_company
             if company:
                 company.operated_this_round = True
-                self.advance_turn()
+                self._advance_operating_round_turn()
                 return {
                     "success": True,
                     "action": "auto_complete",
@@ -217,8 +220,18 @@ class TurnManager:
         Args:
             player_id: Player to give priority deal.
         """
-        for player in self.state.players.values():
-            player.priority_deal = player.id == player_id
+        state = self.state
+        if state.priority_deal_player_id is not None:
+            previous = state.players.get(state.priority_deal_player_id)
+            if previous is not None:
+                previous.priority_deal = False
+
+        player = state.players.get(player_id)
+        if player is not None:
+            player.priority_deal = True
+            state.priority_deal_player_id = player_id
+        else:
+            state.priority_deal_player_id = None
 
     def get_player_order(self) -> list[str]:
         """Get current player order.
@@ -230,17 +243,12 @@ class TurnManager:
 
     def reorder_players_for_stock_round(self) -> None:
         """Reorder players for new stock round based on priority deal."""
-        # Find player with priority deal
-        priority_player = None
-        for player in self.state.players.values():
-            if player.priority_deal:
-                priority_player = player.id
-                break
-
-        if priority_player and priority_player in self.state.player_order:
-            # Rotate order so priority player is first
-            idx = self.state.player_order.index(priority_player)
-            self.state.player_order = (
-                self.state.player_order[idx:] + self.state.player_order[:idx]
-            )
+        order = self.state.player_order
+        priority_player = self.state.priority_deal_player_id
+        if priority_player and priority_player in order:
+            # Rotate order in place so priority player is first
+            idx = order.index(priority_player)
+            if idx:
+                order.extend(order[:idx])
+                del order[:idx]
             self.state.current_player_index = 0
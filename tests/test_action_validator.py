@@ -0,0 +1,47 @@
+"""Tests for ActionValidator certificate limit checks."""
+
+from teletycoon.models.game_state import GameState
+from teletycoon.models.player import Player, PlayerType
+from teletycoon.turn_manager import ActionValidator
+
+AT_LIMIT = (False, "At certificate limit")
+
+
+def _new_game() -> GameState:
+    """Create a 6-player game (certificate limit 11) with AR and IR floated."""
+    state = GameState(id="test_cert_limit")
+    for number in range(1, 7):
+        state.add_player(Player(f"p{number}", f"Player {number}", PlayerType.HUMAN))
+    state.initialize_game()
+    state.companies["AR"].float_company(70)
+    state.companies["IR"].float_company(70)
+    return state
+
+
+def test_buys_rejected_at_certificate_limit():
+    """Buying or starting a company fails once p1 holds 11 certificates."""
+    state = _new_game()
+    validator = ActionValidator(state)
+    buy_ipo = {"type": "buy_ipo", "company_id": "AR"}
+    buy_market = {"type": "buy_market", "company_id": "IR"}
+    start_company = {"type": "start_company", "company_id": "SR", "par_value": 70}
+
+    state.stock_market.stocks["AR"].buy_from_ipo("p1", 5)
+    state.stock_market.stocks["IR"].buy_from_ipo("p1", 5)
+    state.stock_market.stocks["IR"].buy_from_ipo("p2", 1)
+    state.stock_market.stocks["IR"].sell_to_market("p2", 1)
+    assert state.count_certificates("p1") == 10
+    assert validator.validate_action("p1", buy_ipo) == (True, "")
+    assert validator.validate_action("p1", buy_market) == (True, "")
+    assert validator.validate_action("p1", start_company) == (True, "")
+
+    state.stock_market.stocks["AR"].buy_from_ipo("p1", 1)
+    assert state.count_certificates("p1") == state.cert_limit == 11
+    assert validator.validate_action("p1", buy_ipo) == AT_LIMIT
+    assert validator.validate_action("p1", buy_market) == AT_LIMIT
+    assert validator.validate_action("p1", start_company) == AT_LIMIT
+
+    # The president's certificate frees one slot
+    state.companies["AR"].president_id = "p1"
+    assert state.count_certificates("p1") == 10
+    assert validator.validate_action("p1", buy_ipo) == (True, "")
@@ -10,6 +10,7 @@ import logging
 from dataclasses import dataclass
 
 from teletycoon.engine.game_engine import GameEngine
+from teletycoon.models.company import CompanyStatus
 from teletycoon.models.game_state import GamePhase, RoundType
 from teletycoon.models.player import PlayerType
 
@@ -19,7 +20,7 @@ logging.basicConfig(level=logging.WARNING, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundTracker:
     """Tracks round transitions for verification."""
 
@@ -70,45 +71,17 @@ def test_full_game_deterministic():
 
     # Track rounds
     tracker = RoundTracker()
-    max_iterations = 500  # Safety limit
+    handlers = {
+        GamePhase.STOCK_ROUND: _execute_stock_round_turn,
+        GamePhase.OPERATING_ROUND: _execute_operating_round_turn,
+    }
     iteration = 0
 
-    last_phase = None
-    last_sr = 0
-    last_or = 0
-
-    while (
-        engine.state.current_phase != GamePhase.GAME_END and iteration < max_iterations
-    ):
-        iteration += 1
-        state = engine.state
-
-        # Track phase transitions
-        if state.current_phase == GamePhase.STOCK_ROUND:
-            if (
-                last_phase != GamePhase.STOCK_ROUND
-                or last_sr != state.stock_round_number
-            ):
-                tracker.record_stock_round(state.stock_round_number)
-                if state.stock_round_number <= 5 or state.stock_round_number % 10 == 0:
-                    print(f"SR{state.stock_round_number} (Bank: ¥{state.bank_cash})")
-                last_phase = GamePhase.STOCK_ROUND
-                last_sr = state.stock_round_number
-
-        elif state.current_phase == GamePhase.OPERATING_ROUND:
-            if (
-                last_phase != GamePhase.OPERATING_ROUND
-                or last_or != state.operating_round_number
-            ):
-                tracker.record_operating_round(state.operating_round_number)
-                last_phase = GamePhase.OPERATING_ROUND
-                last_or = state.operating_round_number
-
+    for iteration, phase in enumerate(_drive(engine, tracker), start=1):
         # Execute actions based on current phase
-        if state.current_phase == GamePhase.STOCK_ROUND:
-            _execute_stock_round_turn(engine, tracker)
-        elif state.current_phase == GamePhase.OPERATING_ROUND:
-            _execute_operating_round_turn(engine, tracker)
+        handler = handlers.get(phase)
+        if handler:
+            handler(engine)
 
     # Game ended
     print("\n" + "=" * 60)
@@ -151,7 +124,50 @@ def test_full_game_deterministic():
     return True
 
 
-def _execute_stock_round_turn(engine: GameEngine, tracker: RoundTracker):
+def _drive(engine: GameEngine, tracker: RoundTracker, max_iterations: int = 500):
+    """Yield the current phase once per turn until the game ends.
+
+    Records each new stock or operating round on the tracker before its
+    first turn is yielded. Stops after max_iterations turns as a safety
+    limit.
+    """
+    state = engine.state
+    last_phase = None
+    last_sr = 0
+    last_or = 0
+
+    for _ in range(max_iterations):
+        phase = state.current_phase
+        if phase is GamePhase.GAME_END:
+            return
+
+        # Track phase transitions
+        if phase is GamePhase.STOCK_ROUND:
+            if last_phase is not phase or last_sr != state.stock_round_number:
+                tracker.record_stock_round(state.stock_round_number)
+                if state.stock_round_number <= 5 or state.stock_round_number % 10 == 0:
+                    print(f"SR{state.stock_round_number} (Bank: ¥{state.bank_cash})")
+                last_phase = phase
+                last_sr = state.stock_round_number
+
+        elif phase is GamePhase.OPERATING_ROUND:
+            if last_phase is not phase or last_or != state.operating_round_number:
+                tracker.record_operating_round(state.operating_round_number)
+                last_phase = phase
+                last_or = state.operating_round_number
+
+        yield phase
+
+
+def _group_actions(actions: list[dict]) -> dict[str, list[dict]]:
+    """Group available actions by their type, keeping their order."""
+    actions_by_type: dict[str, list[dict]] = {}
+    for action in actions:
+        actions_by_type.setdefault(action["type"], []).append(action)
+    return actions_by_type
+
+
+def _execute_stock_round_turn(engine: GameEngine):
     """Execute a single turn in the stock round."""
     state = engine.state
     player = state.current_player
@@ -164,18 +180,20 @@ def _execute_stock_round_turn(engine: GameEngine, tracker: RoundTracker):
     # 2. Buy shares if we have money
     # 3. Pass when we can't afford anything
 
-    actions = engine.get_available_actions()
-    action_types = [a["type"] for a in actions]
+    actions_by_type = _group_actions(engine.get_available_actions())
 
-    # Get companies sorted deterministically
-    companies = sorted(engine.state.companies.items())
-    started_companies = [(cid, c) for cid, c in companies if c.status.value == "active"]
-    unstarted_companies = [
-        (cid, c) for cid, c in companies if c.status.value == "unstarted"
-    ]
+    # Walk companies in a deterministic order, splitting them by status
+    started_count = 0
+    unstarted_companies = []
+    for cid, c in sorted(state.companies.items()):
+        status = c.status
+        if status is CompanyStatus.ACTIVE:
+            started_count += 1
+        elif status is CompanyStatus.UNSTARTED:
+            unstarted_companies.append((cid, c))
 
     # Strategy: Start up to 4 companies, then buy shares aggressively
-    if "start_company" in action_types and len(started_companies) < 4:
+    if "start_company" in actions_by_type and started_count < 4:
         # Start a company at highest affordable par value for faster bank drain
         for company_id, company in unstarted_companies:
             # Try par value 100 first (costs 200 for president cert)
@@ -191,17 +209,16 @@ def _execute_stock_round_turn(engine: GameEngine, tracker: RoundTracker):
                 return
 
     # Buy shares from IPO if we can afford it
-    if "buy_ipo" in action_types:
-        for action in actions:
-            if action["type"] == "buy_ipo" and player.can_afford(action["price"]):
-                engine.execute_action("buy_ipo", company_id=action["company_id"])
-                return
+    for action in actions_by_type.get("buy_ipo", ()):
+        if player.can_afford(action["price"]):
+            engine.execute_action("buy_ipo", company_id=action["company_id"])
+            return
 
     # Otherwise pass
     engine.execute_action("pass")
 
 
-def _execute_operating_round_turn(engine: GameEngine, tracker: RoundTracker):
+def _execute_operating_round_turn(engine: GameEngine):
     """Execute actions for the operating company."""
     state = engine.state
     company = state.operating_company
@@ -216,23 +233,20 @@ def _execute_operating_round_turn(engine: GameEngine, tracker: RoundTracker):
     # 3. Pay dividends from bank to drain it
     # 4. Done
 
-    actions = engine.get_available_actions()
-    action_types = [a["type"] for a in actions]
+    # Fetched once per turn and reused after a train purchase
+    actions_by_type = _group_actions(engine.get_available_actions())
 
     # Buy train if we can afford it (buy multiple trains to advance phases)
-    if "buy_train" in action_types:
-        buy_actions = [a for a in actions if a["type"] == "buy_train"]
-        if buy_actions:
-            # Buy the most expensive train we can afford to advance phase faster
-            affordable = [a for a in buy_actions if company.can_buy_train(a["cost"])]
-            if affordable:
-                most_expensive = max(affordable, key=lambda a: a["cost"])
-                engine.execute_action(
-                    "buy_train", train_type=most_expensive["train_type"]
-                )
+    buy_actions = actions_by_type.get("buy_train")
+    if buy_actions:
+        # Buy the most expensive train we can afford to advance phase faster
+        affordable = [a for a in buy_actions if company.can_buy_train(a["cost"])]
+        if affordable:
+            most_expensive = max(affordable, key=lambda a: a["cost"])
+            engine.execute_action("buy_train", train_type=most_expensive["train_type"])
 
     # Run trains for revenue and pay dividends
-    if company.trains and "run_trains" in action_types:
+    if company.trains and "run_trains" in actions_by_type:
         result = engine.execute_action("run_trains")
         revenue = result.get("revenue", 0)
 
@@ -0,0 +1,127 @@
+"""Tests for GameState operating order and certificate counts."""
+
+from teletycoon.models.company import CompanyStatus, create_1889_companies
+from teletycoon.models.game_state import CERT_LIMITS_1889, GameState, RoundType
+from teletycoon.models.player import Player, PlayerType
+
+
+def _expected_operator(state: GameState):
+    """Recompute the operating company from a full price sort."""
+    ordered = sorted(state.active_companies, key=lambda c: c.stock_price, reverse=True)
+    return next((c for c in ordered if not c.operated_this_round), None)
+
+
+def _start_operating_round(active_ids: list[str]) -> GameState:
+    """Create a state in an operating round with the given companies floated."""
+    state = GameState(id="test_operating_order", companies=create_1889_companies())
+    for company_id in active_ids:
+        state.companies[company_id].status = CompanyStatus.ACTIVE
+    state.round_type = RoundType.OPERATING
+    return state
+
+
+def _operate_all(state: GameState) -> list[str]:
+    """Mark companies operated one by one, checking each step."""
+    order = []
+    while (company := state.operating_company) is not None:
+        assert company is _expected_operator(state)
+        order.append(company.id)
+        company.operated_this_round = True
+    assert _expected_operator(state) is None
+    return order
+
+
+def test_operating_order_follows_price_changes():
+    """Price moves mid-round re-rank the companies still to operate."""
+    state = _start_operating_round(["AR", "IR", "SR", "KO"])
+    state.companies["AR"].stock_price_index = 5
+    state.companies["IR"].stock_price_index = 8
+    state.companies["SR"].stock_price_index = 8  # Tie with IR
+    state.companies["KO"].stock_price_index = 3
+
+    assert state.operating_company is _expected_operator(state)
+    assert state.operating_company.id == "IR"  # Ties keep company order
+    state.companies["IR"].operated_this_round = True
+
+    # KO jumps ahead of SR, then AR ties KO
+    state.companies["KO"].stock_price_index = 10
+    assert state.operating_company is _expected_operator(state)
+    assert state.operating_company.id == "KO"
+    state.companies["AR"].stock_price_index = 10
+    assert state.operating_company is _expected_operator(state)
+    assert state.operating_company.id == "AR"
+
+    # Dropping prices works as well as raising them
+    state.companies["AR"].stock_price_index = 0
+    state.companies["KO"].stock_price_index = 1
+    assert _operate_all(state) == ["SR", "KO", "AR"]
+
+
+def test_operating_order_includes_companies_floated_mid_round():
+    """A company floated during the round joins the operating order."""
+    state = _start_operating_round(["AR", "IR"])
+    state.companies["AR"].stock_price_index = 6
+    state.companies["IR"].stock_price_index = 4
+
+    assert state.operating_company.id == "AR"
+    state.companies["AR"].operated_this_round = True
+
+    state.companies["SR"].status = CompanyStatus.ACTIVE
+    state.companies["SR"].stock_price_index = 9
+    state.companies["KO"].status = CompanyStatus.ACTIVE
+    state.companies["KO"].stock_price_index = 4  # Tie with IR
+    assert _operate_all(state) == ["SR", "IR", "KO"]
+
+
+def test_operating_order_resets_for_next_round():
+    """Every active company operates again in the next round."""
+    state = _start_operating_round(["AR", "IR", "SR"])
+    for index, company_id in enumerate(["SR", "AR", "IR"]):
+        state.companies[company_id].stock_price_index = 10 - index
+    assert _operate_all(state) == ["SR", "AR", "IR"]
+
+    state._reset_operated_flags()
+    state.companies["IR"].stock_price_index = 12
+    assert _operate_all(state) == ["IR", "SR", "AR"]
+
+    state.round_type = RoundType.STOCK
+    assert state.operating_company is None
+
+
+def _new_game(player_count: int) -> GameState:
+    """Create an initialized game with players p1..pN."""
+    state = GameState(id="test_certificates")
+    for number in range(1, player_count + 1):
+        state.add_player(Player(f"p{number}", f"Player {number}", PlayerType.HUMAN))
+    state.initialize_game()
+    return state
+
+
+def test_president_certificate_counts_once():
+    """The president's two-share certificate counts as one certificate."""
+    state = _new_game(3)
+    ar = state.stock_market.stocks["AR"]
+    state.companies["AR"].president_id = "p1"
+
+    assert state.count_certificates("p1") == 0
+    ar.buy_from_ipo("p1", 2)
+    assert state.count_certificates("p1") == 1
+    ar.buy_from_ipo("p1", 1)
+    assert state.count_certificates("p1") == 2
+
+    # Other holders count one certificate per share
+    ar.buy_from_ipo("p2", 2)
+    assert state.count_certificates("p2") == 2
+    state.stock_market.stocks["IR"].buy_from_ipo("p1", 3)
+    assert state.count_certificates("p1") == 5
+
+    # Losing the presidency counts every share again
+    state.companies["AR"].president_id = "p2"
+    assert state.count_certificates("p1") == 6
+    assert state.count_certificates("p2") == 1
+
+
+def test_cert_limit_by_player_count():
+    """The certificate limit follows the 1889 player-count table."""
+    for player_count, limit in CERT_LIMITS_1889.items():
+        assert _new_game(player_count).cert_limit == limit
@@ -0,0 +1,96 @@
+"""Tests for the StockMarket holding and pool indexes."""
+
+import random
+
+from teletycoon.models.stock import StockMarket
+
+COMPANY_IDS = ["AR", "IR", "SR", "KO"]
+PLAYER_IDS = ["p1", "p2", "p3"]
+
+
+def _new_market() -> StockMarket:
+    """Create a market with a few companies."""
+    market = StockMarket()
+    for company_id in COMPANY_IDS:
+        market.add_company(company_id)
+    return market
+
+
+def _assert_indexes_match(market: StockMarket) -> None:
+    """Check every index against a recomputation from player_shares."""
+    for player_id in PLAYER_IDS:
+        expected = {
+            company_id: stock.player_shares[player_id]
+            for company_id, stock in market.stocks.items()
+            if stock.player_shares.get(player_id, 0) > 0
+        }
+        assert market.get_player_portfolio(player_id) == expected
+        assert market.get_total_shares_owned(player_id) == sum(expected.values())
+
+    assert set(market.with_ipo_shares) == {
+        company_id for company_id, stock in market.stocks.items() if stock.ipo_shares
+    }
+    assert set(market.with_market_shares) == {
+        company_id for company_id, stock in market.stocks.items() if stock.market_shares
+    }
+
+    for stock in market.stocks.values():
+        majors = {pid for pid, shares in stock.player_shares.items() if shares >= 2}
+        assert stock.major_holders == majors
+        for player_id in PLAYER_IDS:
+            assert stock.has_other_major_holder(player_id) == bool(majors - {player_id})
+
+
+def test_trades_keep_indexes_in_sync():
+    """Buying and selling across players updates every index."""
+    market = _new_market()
+    _assert_indexes_match(market)
+
+    ar = market.stocks["AR"]
+    assert ar.buy_from_ipo("p1", 2)
+    assert ar.buy_from_ipo("p2", 1)
+    _assert_indexes_match(market)
+    assert ar.major_holders == {"p1"}
+
+    assert ar.sell_to_market("p1", 1)
+    _assert_indexes_match(market)
+    assert "AR" in market.with_market_shares
+    assert ar.major_holders == set()
+
+    assert ar.buy_from_market("p2", 1)
+    _assert_indexes_match(market)
+    assert "AR" not in market.with_market_shares
+    assert ar.major_holders == {"p2"}
+
+    # Selling a whole holding drops it from the portfolio
+    assert ar.sell_to_market("p2", 2)
+    _assert_indexes_match(market)
+    assert market.get_player_portfolio("p2") == {}
+
+    # Emptying the IPO drops the company from the IPO pool
+    ir = market.stocks["IR"]
+    assert ir.buy_from_ipo("p3", 10)
+    _assert_indexes_match(market)
+    assert "IR" not in market.with_ipo_shares
+
+    # Rejected trades leave everything unchanged
+    assert not ir.buy_from_ipo("p1", 1)
+    assert not ir.sell_to_market("p1", 1)
+    assert not market.stocks["SR"].buy_from_market("p1", 1)
+    _assert_indexes_match(market)
+
+
+def test_random_trades_keep_indexes_in_sync():
+    """Indexes match a full recomputation after random trades."""
+    rng = random.Random(1889)
+    market = _new_market()
+
+    for _ in range(2000):
+        stock = market.stocks[rng.choice(COMPANY_IDS)]
+        player_id = rng.choice(PLAYER_IDS)
+        count = rng.randint(1, 3)
+        trade = rng.choice(
+            [stock.buy_from_ipo, stock.buy_from_market, stock.sell_to_market]
+        )
+        trade(player_id, count)
+        _assert_indexes_match(market)
@@ -0,0 +1,32 @@
+"""Tests for Tile track connections."""
+
+from teletycoon.models.tile import Tile, TileType, TrackDirection
+
+
+def test_connections_round_trip():
+    """Added directions show up in the mask, the count and the set view."""
+    tile = Tile(id="A1", tile_type=TileType.PLAIN, row=0, col=0)
+    assert tile.connections == 0
+    assert tile.connection_count() == 0
+    assert tile.track_connections == set()
+
+    tile.add_connection(TrackDirection.NORTH)
+    tile.add_connection(TrackDirection.SOUTH)
+    tile.add_connection(TrackDirection.NORTHWEST)
+    assert tile.connections == 0b101001
+    assert tile.connection_count() == 3
+    assert tile.track_connections == {
+        TrackDirection.NORTH,
+        TrackDirection.SOUTH,
+        TrackDirection.NORTHWEST,
+    }
+    for direction in TrackDirection:
+        assert tile.has_connection(direction) == (direction in tile.track_connections)
+
+    # Adding a direction twice changes nothing
+    tile.add_connection(TrackDirection.SOUTH)
+    assert tile.connection_count() == 3
+
+    # The mask can also be passed in directly
+    copy = Tile(id="A2", tile_type=TileType.PLAIN, row=0, col=1, connections=0b101001)
+    assert copy.track_connections == tile.track_connections
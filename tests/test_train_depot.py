@@ -0,0 +1,100 @@
+"""Tests for TrainDepot availability tracking."""
+
+from teletycoon.database import GameRepository, get_session
+from teletycoon.database.base import init_db
+from teletycoon.models.company import create_1889_companies
+from teletycoon.models.game_state import GameState
+from teletycoon.models.train import TRAIN_DEFINITIONS, TrainDepot, TrainType
+
+
+def _assert_index_matches(depot: TrainDepot) -> None:
+    """Check the availability index against a scan of every train."""
+    unowned = [t for t in depot.trains if t.owner_id is None and not t.rusted]
+    for train_type in TrainType:
+        expected = [t for t in unowned if t.train_type == train_type]
+        assert depot.available_count(train_type) == len(expected)
+
+    in_phase = [
+        t
+        for t in unowned
+        if TRAIN_DEFINITIONS[t.train_type].phase <= depot.current_phase
+    ]
+    assert depot.get_available_trains() == in_phase
+    assert depot.get_next_available_train_type() == (
+        in_phase[0].train_type if in_phase else None
+    )
+
+
+def test_buying_trains_updates_availability():
+    """Each purchase takes the next train and may advance the phase."""
+    depot = TrainDepot()
+    _assert_index_matches(depot)
+
+    for remaining in range(5, -1, -1):
+        train = depot.buy_train(TrainType.TRAIN_2, "AR")
+        assert train is not None
+        assert train.owner_id == "AR"
+        assert depot.available_count(TrainType.TRAIN_2) == remaining
+        assert depot.current_phase == 2
+        _assert_index_matches(depot)
+
+    # The 2-trains are sold out
+    assert depot.buy_train(TrainType.TRAIN_2, "AR") is None
+    assert depot.get_next_available_train_type() is None
+
+    # The first 3-train opens phase 3
+    assert depot.buy_train(TrainType.TRAIN_3, "IR") is not None
+    assert depot.current_phase == 3
+    assert depot.available_count(TrainType.TRAIN_3) == 4
+    assert depot.get_next_available_train_type() == TrainType.TRAIN_3
+    _assert_index_matches(depot)
+
+    # The first 4-train opens phase 4 and rusts the 2-trains
+    assert depot.buy_train(TrainType.TRAIN_4, "SR") is not None
+    rusted = depot.rust_trains(TrainType.TRAIN_4)
+    assert depot.current_phase == 4
+    assert depot.train_limit == 3
+    assert [t.train_type for t in rusted] == [TrainType.TRAIN_2] * 6
+    assert depot.available_count(TrainType.TRAIN_4) == 3
+    _assert_index_matches(depot)
+
+
+def test_availability_survives_save_and_load(tmp_path):
+    """A loaded depot rebuilds its index and keeps selling in order."""
+    state = GameState(id="test_depot_round_trip", companies=create_1889_companies())
+    db_path = tmp_path / "teletycoon.db"
+    init_db(db_path)
+    # Save once before any purchase, as the engine does, so the company
+    # rows exist when trains are linked to them
+    with get_session(db_path) as session:
+        GameRepository(session).save_game_state(state)
+
+    depot = state.train_depot
+    for company_id, train_type in [
+        ("AR", TrainType.TRAIN_2),
+        ("AR", TrainType.TRAIN_2),
+        ("IR", TrainType.TRAIN_2),
+        ("IR", TrainType.TRAIN_3),
+    ]:
+        train = depot.buy_train(train_type, company_id)
+        state.companies[company_id].add_train(train)
+
+    with get_session(db_path) as session:
+        GameRepository(session).save_game_state(state)
+    with get_session(db_path) as session:
+        loaded = GameRepository(session).load_game_state(state.id)
+
+    assert loaded is not None
+    loaded_depot = loaded.train_depot
+    assert loaded_depot.current_phase == 3
+    assert loaded_depot.available_count(TrainType.TRAIN_2) == 3
+    assert loaded_depot.available_count(TrainType.TRAIN_3) == 4
+    assert [t.id for t in loaded.companies["IR"].trains] == ["train_3", "train_7"]
+    _assert_index_matches(loaded_depot)
+
+    # The next purchase takes the first unsold train, not a sold one
+    train = loaded_depot.buy_train(TrainType.TRAIN_2, "SR")
+    assert train is not None
+    assert train.id == "train_4"
+    assert loaded_depot.available_count(TrainType.TRAIN_2) == 2
+    _assert_index_matches(loaded_depot)
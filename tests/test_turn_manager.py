@@ -0,0 +1,132 @@
+"""Tests for TurnManager turn tracking."""
+
+from teletycoon.database import GameRepository, get_session
+from teletycoon.database.base import init_db
+from teletycoon.engine.game_engine import GameEngine
+from teletycoon.models.player import PlayerType
+from teletycoon.turn_manager import TurnManager
+
+
+def _start_game(game_id: str) -> GameEngine:
+    """Create and start a 3-player game without persistence."""
+    engine = GameEngine(game_id=game_id, enable_persistence=False)
+    engine.add_player("p1", "Alice", PlayerType.HUMAN)
+    engine.add_player("p2", "Bob", PlayerType.HUMAN)
+    engine.add_player("p3", "Cara", PlayerType.HUMAN)
+    engine.start_game()
+    return engine
+
+
+def test_turn_info_contents():
+    """Turn info reports the round, current player and passes."""
+    engine = _start_game("test_turn_info")
+    turn_manager = TurnManager(engine.state)
+
+    assert turn_manager.get_turn_info() == {
+        "phase": "stock_round",
+        "round_type": "stock",
+        "stock_round": 1,
+        "operating_round": 0,
+        "current_player": {"id": "p1", "name": "Alice"},
+        "operating_company": {"id": None, "name": None},
+        "passed_players": [],
+        "players_remaining": 3,
+    }
+
+    engine.execute_action("start_company", company_id="AR", par_value=65)
+    engine.execute_action("pass")  # Bob
+
+    info = turn_manager.get_turn_info()
+    assert info["current_player"] == {"id": "p3", "name": "Cara"}
+    assert info["passed_players"] == ["p2"]
+    assert info["players_remaining"] == 2
+
+    engine.execute_action("pass")  # Cara
+    engine.execute_action("pass")  # Alice
+
+    info = turn_manager.get_turn_info()
+    assert info["phase"] == "operating_round"
+    assert info["round_type"] == "operating"
+    assert info["operating_round"] == 1
+    assert info["operating_company"] == {"id": "AR", "name": "Awa Railroad"}
+    assert info["passed_players"] == []
+    assert info["players_remaining"] == 3
+
+
+def test_turn_info_is_a_snapshot():
+    """Turn info is a plain dict that later turns do not change."""
+    engine = _start_game("test_turn_info_snapshot")
+    turn_manager = TurnManager(engine.state)
+
+    info = turn_manager.get_turn_info()
+    assert type(info) is dict
+
+    engine.execute_action("pass")  # Alice
+    assert info["current_player"]["id"] == "p1"
+    assert info["passed_players"] == []
+
+    # Mutating a result does not leak into the next one
+    info["passed_players"].append("p9")
+    assert turn_manager.get_turn_info()["passed_players"] == ["p1"]
+
+
+def _holders(engine: GameEngine) -> list[str]:
+    """Get IDs of players whose priority_deal flag is set."""
+    return [p.id for p in engine.state.players.values() if p.priority_deal]
+
+
+def test_priority_deal_moves_after_passes():
+    """Priority deal moves between players and leads the next order."""
+    engine = _start_game("test_priority_deal")
+    turn_manager = TurnManager(engine.state)
+
+    turn_manager.set_priority_deal("p2")
+    assert engine.state.priority_deal_player_id == "p2"
+    assert _holders(engine) == ["p2"]
+
+    # Everyone passes; with no companies the next stock round starts
+    for _ in range(3):
+        engine.execute_action("pass")
+    assert engine.state.stock_round_number == 2
+
+    turn_manager.reorder_players_for_stock_round()
+    assert engine.state.player_order == ["p2", "p3", "p1"]
+    assert turn_manager.get_current_player_id() == "p2"
+
+    turn_manager.set_priority_deal("p3")
+    assert engine.state.priority_deal_player_id == "p3"
+    assert _holders(engine) == ["p3"]
+
+    turn_manager.reorder_players_for_stock_round()
+    assert engine.state.player_order == ["p3", "p1", "p2"]
+
+    # Unknown players clear the priority deal
+    turn_manager.set_priority_deal("p9")
+    assert engine.state.priority_deal_player_id is None
+    assert _holders(engine) == []
+
+
+def test_priority_deal_survives_save_and_load(tmp_path):
+    """The priority holder is restored when a game is loaded."""
+    engine = _start_game("test_priority_round_trip")
+    TurnManager(engine.state).set_priority_deal("p2")
+
+    db_path = tmp_path / "teletycoon.db"
+    init_db(db_path)
+    with get_session(db_path) as session:
+        GameRepository(session).save_game_state(engine.state)
+    with get_session(db_path) as session:
+        state = GameRepository(session).load_game_state(engine.state.id)
+
+    assert state is not None
+    assert state.priority_deal_player_id == "p2"
+    assert [p.id for p in state.players.values() if p.priority_deal] == ["p2"]
+
+    # The loaded holder is cleared when priority moves on
+    turn_manager = TurnManager(state)
+    turn_manager.set_priority_deal("p1")
+    assert not state.players["p2"].priority_deal
+    assert state.players["p1"].priority_deal
+
+    turn_manager.reorder_players_for_stock_round()
+    assert state.player_order == ["p1", "p2", "p3"]